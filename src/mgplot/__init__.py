@@ -5,11 +5,11 @@ such as bar plots, line plots, growth plots, and seasonal trend plots. It also i
 for color management and finalising plots with consistent styling.
 """
 
-# --- version and author
-import importlib.metadata
-
 # --- local imports
 #    Do not import the utilities, axis_utils nor keyword_checking modules here.
+#    These imports are deliberately eager: most public functions share their
+#    name with their submodule (eg. line_plot), so lazy loading would let any
+#    later submodule import rebind mgplot.line_plot to the module itself.
 from mgplot.bar_plot import BarKwargs, bar_plot
 from mgplot.colors import (
     abbreviate_state,
@@ -21,7 +21,7 @@ from mgplot.colors import (
     state_names,
 )
 from mgplot.fill_between_plot import FillBetweenKwargs, fill_between_plot
-from mgplot.finalise_plot import FinaliseKwargs, finalise_plot
+from mgplot.finalise_plot import FinaliseKwargs, finalise_plot, wait_for_saves
 from mgplot.finalisers import (
     bar_plot_finalise,
     fill_between_plot_finalise,
@@ -57,13 +57,28 @@ from mgplot.settings import (
 from mgplot.summary_plot import SummaryKwargs, summary_plot
 
 # --- version and author
-try:
-    __version__ = importlib.metadata.version(__name__)
-except importlib.metadata.PackageNotFoundError:
-    __version__ = "0.0.0"  # Fallback for development mode
 __author__ = "Bryan Palmer"
 
 
+def __getattr__(name: str) -> str:
+    """Look up the package version when it is first requested.
+
+    importlib.metadata is the only import mgplot adds beyond pandas and
+    matplotlib, so it is deferred until __version__ is actually used.
+    """
+    if name != "__version__":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib.metadata
+
+    try:
+        version = importlib.metadata.version(__name__)
+    except importlib.metadata.PackageNotFoundError:
+        version = "0.0.0"  # Fallback for development mode
+    globals()["__version__"] = version
+    return version
+
+
 # --- public API
 __all__ = (
     "BarKwargs",
@@ -115,4 +130,5 @@ __all__ = (
     "state_names",
     "summary_plot",
     "summary_plot_finalise",
+    "wait_for_saves",
 )
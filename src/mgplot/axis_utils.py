@@ -8,10 +8,13 @@ such as days, months, quarters, and years.
 """
 
 import calendar
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any, Final
 
+import numpy as np
 from matplotlib.axes import Axes
 from pandas import Index, Period, PeriodIndex, RangeIndex, period_range
 from pandas.api.types import is_string_dtype
@@ -36,6 +39,8 @@ def map_stringindex(data: DataT) -> None | tuple[DataT, list[str]]:
 _AXES_PERIOD_ATTR: Final[str] = "_mgplot_period"
 _AXES_LABEL_OPTS_ATTR: Final[str] = "_mgplot_label_opts"
 DEFAULT_REFRESH_TICKS: Final[int] = 10
+# month abbreviations, indexed 1-12 (frozen once, as calendar.month_abbr formats on each lookup)
+_MONTH_ABBR: Final[tuple[str, ...]] = tuple(calendar.month_abbr)
 
 
 def register_label_options(
@@ -97,20 +102,32 @@ def get_period_axes(axes: Axes) -> None | tuple[str, int, int]:
     return getattr(axes, _AXES_PERIOD_ATTR, None)
 
 
+def period_ordinals(p: PeriodIndex) -> np.ndarray:
+    """Get the integer ordinals of a PeriodIndex, without boxing each Period.
+
+    Note: the returned array may be a view on the index data; do not modify it.
+    """
+    return p.asi8  # type: ignore[attr-defined]  # missing from pandas-stubs
+
+
+def periods_from_ordinals(ordinals: np.ndarray, freq: str) -> PeriodIndex:
+    """Build a PeriodIndex directly from integer ordinals, the inverse of period_ordinals()."""
+    return PeriodIndex.from_ordinals(ordinals, freq=freq)  # type: ignore[attr-defined]  # missing from pandas-stubs
+
+
 def map_periodindex(data: DataT) -> None | tuple[DataT, PeriodIndex]:
     """Map a PeriodIndex to an integer index."""
     if not isinstance(data.index, PeriodIndex):
         return None
     og_index = PeriodIndex(data.index.copy())  # mypy
-    complete = data.index.max().ordinal - data.index.min().ordinal == len(data.index) - 1
-    if complete and (data.index.is_monotonic_decreasing or data.index.is_monotonic_increasing):
-        data.index = RangeIndex(
-            start=og_index[0].ordinal,
-            stop=og_index[-1].ordinal + (1 if og_index[0] < og_index[-1] else -1),
-        )
+    ordinals = period_ordinals(og_index)
+    complete = len(ordinals) > 0 and ordinals.max() - ordinals.min() == len(ordinals) - 1
+    if complete and (og_index.is_monotonic_decreasing or og_index.is_monotonic_increasing):
+        step = 1 if ordinals[0] <= ordinals[-1] else -1
+        data.index = RangeIndex(start=ordinals[0], stop=ordinals[-1] + step, step=step)
     else:
         # not complete, so we will map to ordinals individually
-        data.index = Index(i.ordinal for i in og_index)
+        data.index = Index(ordinals)
 
     if len(data.index) != len(og_index):
         raise ValueError("Internal error: Mapped PeriodIndex, but the lengths do not match.")
@@ -168,18 +185,18 @@ def get_count(p: PeriodIndex, max_ticks: int) -> tuple[int, DateLike, int]:
         return error
 
     # --- calculate
+    first, last = p.min(), p.max()
     for test_freq in frequencies[freq]:
         r_freq = r_freqs[test_freq]
+        span = last.asfreq(r_freq, how="end").ordinal - first.asfreq(r_freq, how="end").ordinal + 1
         for interval in intervals[test_freq]:
-            count = (
-                p.max().asfreq(r_freq, how="end").ordinal - p.min().asfreq(r_freq, how="end").ordinal + 1
-            ) // interval
+            count = span // interval
             if count <= max_ticks:
                 return count, test_freq, interval
     return error
 
 
-def day_labeller(labels: dict[Period, str]) -> dict[Period, str]:
+def day_labeller(periods: PeriodIndex) -> list[str]:
     """Label the selected days."""
 
     def add_month(label: str, month: str) -> str:
@@ -191,18 +208,20 @@ def day_labeller(labels: dict[Period, str]) -> dict[Period, str]:
         label = label.replace("\n", " ") if len(label) > days_only else f"{label} {current_month}"
         return f"{label}\n{year}"
 
-    if not labels:
+    labels: list[str] = []
+    if periods.empty:
         return labels
 
-    start = min(labels.keys())
-    month_previous: str = calendar.month_abbr[start.month - 1 if start.month > 1 else 12]
-    year_previous: str = str(start.year if start.month > 1 else start.year - 1)
-    final_year = str(start.year) == year_previous
+    days, months, years = periods.day.tolist(), periods.month.tolist(), periods.year.tolist()
+    start_month, start_year = months[0], years[0]  # periods are in ascending order
+    month_previous: str = _MONTH_ABBR[start_month - 1 if start_month > 1 else 12]
+    year_previous: str = str(start_year if start_month > 1 else start_year - 1)
+    final_year = str(start_year) == year_previous
 
-    for period in sorted(labels.keys()):
-        label = str(period.day)
-        month = calendar.month_abbr[period.month]
-        year = str(period.year)
+    for day, month_number, year_number in zip(days, months, years, strict=True):
+        label = str(day)
+        month = _MONTH_ABBR[month_number]
+        year = str(year_number)
 
         if month_previous != month:
             label = add_month(label, month)
@@ -213,173 +232,213 @@ def day_labeller(labels: dict[Period, str]) -> dict[Period, str]:
             label = add_year(label, year, month)
             year_previous = year
 
-        labels[period] = label
+        labels.append(label)
 
-    if final_year and labels:
-        final_period = max(labels.keys())
-        final_month = calendar.month_abbr[final_period.month]
-        final_year_str = str(final_period.year)
-        labels[final_period] = add_year(labels[final_period], final_year_str, final_month)
+    if final_year:
+        labels[-1] = add_year(labels[-1], str(years[-1]), _MONTH_ABBR[months[-1]])
 
     return labels
 
 
-def month_locator(p: PeriodIndex, interval: int) -> dict[Period, str]:
+def first_aligned(values: Index | np.ndarray, interval: int) -> int:
+    """Find the position of the first value that is a multiple of interval.
+
+    Used by the locators to align the first tick to a calendar boundary.
+    Returns 0 if no value is aligned.
+    """
+    aligned = np.flatnonzero(np.asarray(values) % interval == 0)
+    return int(aligned[0]) if aligned.size else 0
+
+
+def month_locator(p: PeriodIndex, interval: int) -> PeriodIndex:
     """Select the months to label."""
-    subset = PeriodIndex([c for c in p if c.day == 1]) if p.freqstr[0] == "D" else p
+    subset = p[p.day == 1] if p.freqstr[0] == "D" else p
 
     start = 0
     if interval > 1:
-        mod_months = [(c.month - 1) % interval for c in subset]
-        start = mod_months.index(0) if 0 in mod_months else 0
-    return dict.fromkeys(subset[start::interval], "")
+        start = first_aligned(subset.month - 1, interval)
+    return subset[start::interval]
 
 
-def month_labeller(labels: dict[Period, str]) -> dict[Period, str]:
+def month_labeller(periods: PeriodIndex) -> list[str]:
     """Label the selected months."""
-    if not labels:
+    labels: list[str] = []
+    if periods.empty:
         return labels
 
-    start = min(labels.keys())
-    year_previous: str = str(start.year)
+    months, years = periods.month.tolist(), periods.year.tolist()
+    year_previous: str = str(years[0])  # periods are in ascending order
     final_year = True
 
-    for period in sorted(labels.keys()):
-        label = calendar.month_abbr[period.month]
-        year = str(period.year)
+    for month, year_number in zip(months, years, strict=True):
+        label = _MONTH_ABBR[month]
+        year = str(year_number)
 
         if year_previous != year:
             label = year
             year_previous = year
             final_year = False
-        elif period.month == 1:
+        elif month == 1:
             label = year
             final_year = False
 
-        labels[period] = label
+        labels.append(label)
 
     if final_year:
-        final_period = max(labels.keys())
-        label = labels[final_period]
-        year = str(final_period.year)
-        label = f"{label}\n{year}"
-        labels[final_period] = label
+        labels[-1] = f"{labels[-1]}\n{years[-1]}"
 
     return labels
 
 
-def qtr_locator(p: PeriodIndex, interval: int) -> dict[Period, str]:
+def qtr_locator(p: PeriodIndex, interval: int) -> PeriodIndex:
     """Select the quarters to label."""
     start = 0
     if interval > 1:
-        mod_qtrs = [(c.quarter - 1) % interval for c in p]
-        start = mod_qtrs.index(0) if 0 in mod_qtrs else 0
-    return dict.fromkeys(p[start::interval], "")
+        start = first_aligned(p.quarter - 1, interval)
+    return p[start::interval]
 
 
-def qtr_labeller(labels: dict[Period, str]) -> dict[Period, str]:
+def qtr_labeller(periods: PeriodIndex) -> list[str]:
     """Label the selected quarters."""
-    if not labels:
+    labels: list[str] = []
+    if periods.empty:
         return labels
 
+    quarters, years = periods.quarter.tolist(), periods.year.tolist()
     final_year = True
-    for period in sorted(labels.keys()):
-        quarter = period.quarter
+    for quarter, year in zip(quarters, years, strict=True):
         label = f"Q{quarter}"
         if quarter == 1:
             final_year = False
-            label = f"{period.year}"
-        labels[period] = label
+            label = f"{year}"
+        labels.append(label)
 
     if final_year:
-        final_period = max(labels.keys())
-        label = labels[final_period]
-        year = str(final_period.year)
-        label = f"{label}\n{year}"
-        labels[final_period] = label
+        labels[-1] = f"{labels[-1]}\n{years[-1]}"
 
     return labels
 
 
-def year_locator(p: PeriodIndex, interval: int) -> dict[Period, str]:
+# Select the first Period of each year, keyed by the frequency code
+_YEAR_STARTS: Final[Mapping[str, Callable[[PeriodIndex], PeriodIndex]]] = MappingProxyType(
+    {
+        "D": lambda p: p[(p.month == 1) & (p.day == 1)],
+        "M": lambda p: p[p.month == 1],
+        "Q": lambda p: p[p.quarter == 1],
+    }
+)
+
+
+def year_locator(p: PeriodIndex, interval: int) -> PeriodIndex:
     """Select the years to label."""
-    match p.freqstr[0]:
-        case "D":
-            subset = PeriodIndex([c for c in p if c.month == 1 and c.day == 1])
-        case "M":
-            subset = PeriodIndex([c for c in p if c.month == 1])
-        case "Q":
-            subset = PeriodIndex([c for c in p if c.quarter == 1])
-        case _:
-            subset = p
+    year_starts = _YEAR_STARTS.get(p.freqstr[0])
+    subset = year_starts(p) if year_starts is not None else p
 
     start = 0
     if interval > 1:
-        mod_years = [c.year % interval for c in subset]
-        start = mod_years.index(0) if 0 in mod_years else 0
-    return dict.fromkeys(subset[start::interval], "")
+        start = first_aligned(subset.year, interval)
+    return subset[start::interval]
 
 
-def year_labeller(labels: dict[Period, str]) -> dict[Period, str]:
+def year_labeller(periods: PeriodIndex) -> list[str]:
     """Label the selected years."""
-    if not labels:
-        return labels
+    return [str(year) for year in periods.year.tolist()]
 
-    for period in sorted(labels.keys()):
-        label = str(period.year)
-        labels[period] = label
-    return labels
 
+# Label the selected Periods, keyed by the frequency code of the labels
+_LABELLERS: Final[Mapping[str, Callable[[PeriodIndex], list[str]]]] = MappingProxyType(
+    {
+        "D": day_labeller,
+        "M": month_labeller,
+        "Q": qtr_labeller,
+        "Y": year_labeller,
+    }
+)
 
-def make_labels(p: PeriodIndex, max_ticks: int) -> dict[Period, str]:
-    """Provide a dictionary of labels for the date-like PeriodIndex.
+
+def select_periods(p: PeriodIndex, max_ticks: int) -> tuple[PeriodIndex, str]:
+    """Select the Periods to label for the date-like PeriodIndex.
 
     Args:
         p: PeriodIndex - the PeriodIndex
         max_ticks: int - the maximum number of ticks [suggestive]
 
-    Returns a dictionary:
-        keys are the Periods to label
-        values are the labels to apply
+    Returns a tuple:
+        the selected Periods, in ascending order: PeriodIndex
+        the frequency code of the labels (D, M, Q or Y): str
+    Both are empty if no labels can be selected.
 
     """
-    labels: dict[Period, str] = {}
+    none_selected = (p[:0], "")
     min_ticks: Final[int] = 4
     max_ticks = max(max_ticks, min_ticks)
     count, date_like, interval = get_count(p, max_ticks)
     if date_like == DateLike.BAD:
-        return labels
+        return none_selected
 
     target_freq = r_freqs[date_like]
-    try:
-        complete = period_range(start=p.min(), end=p.max(), freq=p.freqstr)
-    except (ValueError, TypeError) as e:
-        print(f"Error creating period range: {e}")
-        return labels
+    ordinals = period_ordinals(p)
+    if target_freq == "D":
+        # only every interval-th day is needed, so build just those from the ordinals
+        second_interval: Final[int] = 2
+        if interval == second_interval and count % second_interval == 0:
+            start = 0
+        else:
+            start = interval // second_interval
+        wanted = np.arange(ordinals.min() + start, ordinals.max() + 1, interval)
+        return periods_from_ordinals(wanted, p.freqstr), target_freq
+
+    if p.is_monotonic_increasing and p.is_unique and ordinals[-1] - ordinals[0] == len(ordinals) - 1:
+        complete = p  # already contiguous, no need to rebuild it
+    else:
+        try:
+            complete = period_range(start=p.min(), end=p.max(), freq=p.freqstr)
+        except (ValueError, TypeError) as e:
+            print(f"Error creating period range: {e}")
+            return none_selected
 
     match target_freq:
-        case "D":
-            second_interval: Final[int] = 2
-            if interval == second_interval and count % second_interval == 0:
-                start = 0
-            else:
-                start = interval // second_interval
-            labels = dict.fromkeys(complete[start::interval], "")
-            labels = day_labeller(labels)
-
         case "M":
-            labels = month_locator(complete, interval)
-            labels = month_labeller(labels)
-
+            selected = month_locator(complete, interval)
         case "Q":
-            labels = qtr_locator(complete, interval)
-            labels = qtr_labeller(labels)
+            selected = qtr_locator(complete, interval)
+        case _:
+            selected = year_locator(complete, interval)
 
-        case "Y":
-            labels = year_locator(complete, interval)
-            labels = year_labeller(labels)
+    return selected, target_freq
 
-    return labels
+
+def label_periods(selected: PeriodIndex, target_freq: str) -> list[str]:
+    """Label the Periods chosen by select_periods().
+
+    Returns a list of the labels to apply, one for each selected Period.
+    The labellers work on the year, month, etc. fields of the PeriodIndex,
+    so the individual Periods are never materialised.
+
+    Note: the labellers rely on the selected Periods being in ascending
+    order, and do not sort them.
+
+    """
+    labeller = _LABELLERS.get(target_freq)
+    if labeller is None:
+        return [""] * len(selected)
+    return labeller(selected)
+
+
+def make_labels(p: PeriodIndex, max_ticks: int) -> dict[Period, str]:
+    """Provide a dictionary of labels for the date-like PeriodIndex.
+
+    Args:
+        p: PeriodIndex - the PeriodIndex
+        max_ticks: int - the maximum number of ticks [suggestive]
+
+    Returns a dictionary:
+        keys are the Periods to label, in ascending order
+        values are the labels to apply
+
+    """
+    selected, target_freq = select_periods(p, max_ticks)
+    return dict(zip(selected, label_periods(selected, target_freq), strict=True))
 
 
 def make_ilabels(
@@ -400,13 +459,33 @@ def make_ilabels(
         list of tick label strings
 
     """
-    labels = make_labels(p, max_ticks)
-    ticks = [x.ordinal for x in sorted(labels.keys())]
-    ticklabels = [labels[x] for x in sorted(labels.keys())]
+    if p.empty:
+        return [], []
+    ordinals = period_ordinals(p)
+    ticks, labels = period_ilabels(p.freqstr, int(ordinals.min()), int(ordinals.max()), max_ticks)
     if tick_relabel is not None:
-        ticklabels = [tick_relabel(label) for label in ticklabels]
+        return list(ticks), [tick_relabel(label) for label in labels]
+    return list(ticks), list(labels)
+
 
-    return ticks, ticklabels
+@lru_cache(maxsize=128)
+def period_ilabels(
+    freq: str,
+    first: int,
+    last: int,
+    max_ticks: int,
+) -> tuple[tuple[int, ...], tuple[str, ...]]:
+    """Create the integer ticks and labels for a complete range of Periods.
+
+    The ticks and labels depend only on the frequency, the first and last
+    ordinals, and max_ticks, so they are cached on those values. Repeated
+    refreshes of the same axis (eg. in finalise_plot()) are then free.
+    The results are returned as tuples, so the cached values cannot change.
+    """
+    p = period_range(start=Period(ordinal=first, freq=freq), end=Period(ordinal=last, freq=freq), freq=freq)
+    selected, target_freq = select_periods(p, max_ticks)
+    ticks = tuple(period_ordinals(selected).tolist())
+    return ticks, tuple(label_periods(selected, target_freq))
 
 
 def refresh_period_labels(axes: Axes, max_ticks: int | None = None) -> None:
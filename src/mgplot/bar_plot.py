@@ -76,6 +76,22 @@ class AnnoKwargs(TypedDict, total=False):
     rounding: bool | int  # if True, uses default rounding; if int, uses that value
 
 
+def stroke_effects(count: int, anno_kwargs: AnnoKwargs) -> list[list[pe.AbstractPathEffect]] | None:
+    """Get the path effects for each of count within-bar annotations.
+
+    A stroke-effect makes within bar annotations more readable with very
+    small bars. Returns None when no stroke-effect applies.
+    """
+    if anno_kwargs.get("above", False) or "foreground" not in anno_kwargs:
+        return None
+    foreground = anno_kwargs["foreground"]
+    if isinstance(foreground, Sequence) and not isinstance(foreground, str):
+        # per-bar colours - one effect per bar, as colours may be unhashable (eg. RGB lists)
+        return [[pe.withStroke(linewidth=2, foreground=colour)] for colour in foreground[:count]]
+    shared: list[pe.AbstractPathEffect] = [pe.withStroke(linewidth=2, foreground=foreground)]
+    return [shared] * count
+
+
 def annotate_bars(
     series: Series,
     offset: float,
@@ -112,41 +128,44 @@ def annotate_bars(
         "color": anno_kwargs.get("color"),
         "rotation": anno_kwargs.get("rotation"),
     }
-    rounding = default_rounding(series=series, provided=anno_kwargs.get("rounding"))
-    adjustment = (series.max() - series.min()) * ADJUSTMENT_FACTOR
-    zero_correction = series.index.min()
+
+    # --- precompute per-bar values, positions and alignments
+    values = series.to_numpy(dtype=np.float64)
+    present = values[~np.isnan(values)]
+    if not present.size:
+        return  # nothing to annotate
+    lowest, highest = present.min(), present.max()  # also give the largest magnitude
+    rounding = default_rounding(value=max(highest, -lowest), provided=anno_kwargs.get("rounding"))
+    adjustment = (highest - lowest) * ADJUSTMENT_FACTOR
+    non_negative = values >= 0
+    locations = series.index.astype(int).to_numpy() + offset
+    positions = base + np.where(non_negative, adjustment, -adjustment)
+    if above:
+        positions = positions + values
+    if horizontal:
+        xs, ys = positions, locations
+        has = np.where(non_negative, "left", "right")
+        vas = np.full(len(values), "center")
+    else:
+        xs, ys = locations, positions
+        has = np.full(len(values), "center")
+        vas = np.where(non_negative, "bottom", "top")
+    spec = f".{rounding}f"  # the format spec is the same for every bar
+    labels = [format(value, spec) for value in values.tolist()]
+    effects = stroke_effects(len(values), anno_kwargs)
 
     # --- annotate each bar
-    for index, value in zip(series.index.astype(int), series, strict=True):
-        position = base[index - zero_correction] + (adjustment if value >= 0 else -adjustment)
-        if above:
-            position += value
-        if horizontal:
-            placement: dict[str, Any] = {
-                "x": position,
-                "y": index + offset,
-                "ha": "left" if value >= 0 else "right",
-                "va": "center",
-            }
-        else:
-            placement = {
-                "x": index + offset,
-                "y": position,
-                "ha": "center",
-                "va": "bottom" if value >= 0 else "top",
-            }
-        text = axes.text(
-            s=f"{value:.{rounding}f}",
-            **placement,
-            **annotate_style,
+    columns = (xs.tolist(), ys.tolist(), has.tolist(), vas.tolist(), labels)
+    for i, (x, y, ha, va, label) in enumerate(zip(*columns, strict=True)):
+        style = annotate_style if effects is None else {**annotate_style, "path_effects": effects[i]}
+        axes.text(
+            x=x,
+            y=y,
+            s=label,
+            ha=ha,
+            va=va,
+            **style,
         )
-        if not above and "foreground" in anno_kwargs:
-            # apply a stroke-effect to within bar annotations
-            # to make them more readable with very small bars.
-            foreground = anno_kwargs.get("foreground")
-            if isinstance(foreground, Sequence) and not isinstance(foreground, str):
-                foreground = foreground[index - zero_correction]  # per-bar colours
-            text.set_path_effects([pe.withStroke(linewidth=2, foreground=foreground)])
 
 
 class GroupedKwargs(TypedDict):
@@ -168,10 +187,12 @@ def grouped(
 ) -> None:
     """Plot a grouped bar plot."""
     series_count = len(df.columns)
+    positions = df.index.to_numpy()
+    heights = df.to_numpy(dtype=np.float64).T
+    has_data = ~np.isnan(heights).all(axis=1)
 
-    for i, col in enumerate(df.columns):
-        series = df[col]
-        if series.isna().all():
+    for i, (col, series) in enumerate(df.items()):
+        if not has_data[i]:
             continue
         width = kwargs["width"][i]
         if width < MIN_BAR_WIDTH or width > MAX_BAR_WIDTH:
@@ -186,10 +207,12 @@ def grouped(
             "zorder": kwargs["zorder"][i],
             "label": col if kwargs["label_series"][i] else f"_{col}_",
         }
+        # one BarContainer per column (not a PatchCollection), which keeps the
+        # per-series legend entry, zorder and the axes' patches list intact
         if horizontal:
-            axes.barh(y=series.index + offset, width=series, height=adjusted_width, **common)
+            axes.barh(y=positions + offset, width=heights[i], height=adjusted_width, **common)
         else:
-            axes.bar(x=series.index + offset, height=series, width=adjusted_width, **common)
+            axes.bar(x=positions + offset, height=heights[i], width=adjusted_width, **common)
         anno_args["foreground"] = foreground
         annotate_bars(
             series=series,
@@ -219,22 +242,30 @@ def stacked(
     **kwargs: Unpack[StackedKwargs],
 ) -> None:
     """Plot a stacked bar plot."""
-    row_count = len(df)
-    base_plus: np.ndarray = np.zeros(shape=row_count, dtype=np.float64)
-    base_minus: np.ndarray = np.zeros(shape=row_count, dtype=np.float64)
-    for i, col in enumerate(df.columns):
-        series = df[col]
-        base = np.where(series >= 0, base_plus, base_minus)
+    # --- precompute the bases for every column, shape (columns, rows)
+    values = df.to_numpy(dtype=np.float64).T
+    positive = values >= 0  # NaN is neither positive nor negative
+    base_plus: np.ndarray = np.zeros_like(values)
+    base_minus: np.ndarray = np.zeros_like(values)
+    base_plus[1:] = np.cumsum(np.where(positive, values, 0.0), axis=0)[:-1]
+    base_minus[1:] = np.cumsum(np.where(values < 0, values, 0.0), axis=0)[:-1]
+    bases = np.where(positive, base_plus, base_minus)
+    positions = df.index.to_numpy()
+
+    for i, (col, series) in enumerate(df.items()):
+        base = bases[i]
         foreground = kwargs["color"][i]
         common: dict[str, Any] = {
             "color": foreground,
             "zorder": kwargs["zorder"][i],
             "label": col if kwargs["label_series"][i] else f"_{col}_",
         }
+        # one BarContainer per column (not a PatchCollection), which keeps the
+        # per-series legend entry, zorder and the axes' patches list intact
         if horizontal:
-            axes.barh(y=series.index, width=series, left=base, height=kwargs["width"][i], **common)
+            axes.barh(y=positions, width=values[i], left=base, height=kwargs["width"][i], **common)
         else:
-            axes.bar(x=series.index, height=series, bottom=base, width=kwargs["width"][i], **common)
+            axes.bar(x=positions, height=values[i], bottom=base, width=kwargs["width"][i], **common)
         anno_args["foreground"] = foreground
         annotate_bars(
             series=series,
@@ -244,8 +275,6 @@ def stacked(
             horizontal=horizontal,
             **anno_args,
         )
-        base_plus += np.where(series >= 0, series, 0)
-        base_minus += np.where(series < 0, series, 0)
 
 
 def bar_plot(data: DataT, **kwargs: Unpack[BarKwargs]) -> Axes:
@@ -273,7 +302,7 @@ def bar_plot(data: DataT, **kwargs: Unpack[BarKwargs]) -> Axes:
     # no call to check_clean_timeseries here, as bar plots are not
     # necessarily timeseries data. If the data is a Series, it will be
     # converted to a DataFrame with a single column.
-    df = DataFrame(data)  # really we are only plotting DataFrames
+    df = DataFrame(data, copy=False)  # really we are only plotting DataFrames (a new wrapper, not a copy)
     df, kwargs_d = constrain_data(df, **kwargs)
     item_count = len(df.columns)
 
@@ -71,7 +71,7 @@ def fill_between_plot(data: DataFrame, **kwargs: Unpack[FillBetweenKwargs]) -> A
     # --- get axes
     axes, kwargs_d = get_axes(**kwargs_d)
 
-    if data.empty or data.isna().all().all():
+    if data.first_valid_index() is None:  # empty, or nothing but NaNs
         print(f"Warning: No data to plot in {ME}().")
         return axes
 
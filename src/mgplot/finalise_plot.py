@@ -1,9 +1,13 @@
 """Functions to finalise and save plots to the file system."""
 
-import re
+import string
 import unicodedata
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from functools import cache
+from io import BytesIO
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Final, NotRequired, Unpack
 
 import matplotlib.pyplot as plt
@@ -32,12 +36,20 @@ ZERO_LINE_WIDTH: Final[float] = 0.66
 ZERO_LINE_COLOR: Final[str] = "#555555"
 ZERO_AXIS_ADJUSTMENT: Final[float] = 0.02
 DEFAULT_FILE_TITLE_NAME: Final[str] = "plot"
+BACKGROUND_SAVE_WORKERS: Final[int] = 2
 # --- annotated axvline text
 VLINE_TEXT_FONTSIZE: Final[str] = "xx-small"
 VLINE_TEXT_ROTATION: Final[int] = 90
 VLINE_TEXT_OFFSET: Final[float] = 2.0  # points, to the right of the line
 VLINE_TEXT_PAD: Final[float] = 0.01  # axes fraction, in from the top/bottom
 VLINE_AUTO_BAND: Final[float] = 0.02  # fraction of the x-span sampled either side
+# --- filename sanitising: one translation table for the ASCII characters, built once
+#     lowercase letters and digits are kept, separators become hyphens, the rest are dropped
+_FILENAME_TABLE: Final[dict[int, str | None]] = {
+    code: "-" if chr(code).isspace() or chr(code) in "-_" else None
+    for code in range(128)
+    if chr(code) not in string.ascii_lowercase + string.digits
+}
 
 
 class FinaliseKwargs(BaseKwargs):
@@ -97,6 +109,8 @@ VALUE_KWARGS = (
     "xscale",
     "yscale",
 )
+# value settings that are cleared when not provided, unless a plot function already set them
+_REQUIRED_VALUE_KWARGS: Final[frozenset[str]] = frozenset(("title", "xlabel", "ylabel"))
 SPLAT_KWARGS = (
     "axhspan",
     "axvspan",
@@ -110,6 +124,15 @@ HEADER_FOOTER_KWARGS = (
     "lheader",
     "rheader",
 )
+# figure coordinates and alignment for each header/footer: (x, y, ha, va)
+_HEADER_FOOTER_PLACEMENT: Final[Mapping[str, tuple[float, float, str, str]]] = MappingProxyType(
+    {
+        "rfooter": (0.99, 0.001, "right", "bottom"),
+        "lfooter": (0.01, 0.001, "left", "bottom"),
+        "rheader": (0.99, 0.999, "right", "top"),
+        "lheader": (0.01, 0.999, "left", "top"),
+    }
+)
 
 
 def sanitize_filename(filename: str, max_length: int = MAX_FILENAME_LENGTH) -> str:
@@ -135,15 +158,12 @@ def sanitize_filename(filename: str, max_length: int = MAX_FILENAME_LENGTH) -> s
     # Convert to lowercase
     filename = filename.lower()
 
-    # Replace spaces and other separators with hyphens
-    filename = re.sub(r"[\s\-_]+", "-", filename)
-
-    # Remove unsafe characters, keeping only alphanumeric and hyphens
-    filename = re.sub(r"[^a-z0-9\-]", "", filename)
+    # Replace spaces and other separators with hyphens,
+    # and remove unsafe characters, keeping only alphanumeric and hyphens
+    filename = filename.translate(_FILENAME_TABLE)
 
-    # Remove leading/trailing hyphens and collapse multiple hyphens
-    filename = re.sub(r"^-+|-+$", "", filename)
-    filename = re.sub(r"-+", "-", filename)
+    # Collapse multiple hyphens and remove leading/trailing hyphens, in one pass
+    filename = "-".join(filter(None, filename.split("-")))
 
     # Truncate to max length
     if len(filename) > max_length:
@@ -187,26 +207,28 @@ def apply_value_kwargs(axes: Axes, value_kwargs_: Sequence[str], **kwargs: Unpac
     def fail() -> str:
         return ""
 
-    # --- loop over potential value settings
+    # --- loop over potential value settings, collecting them for one Axes.set() call
+    updates: dict[str, object] = {}
     for setting in value_kwargs_:
-        value = _convert_period_value(axes, setting, kwargs.get(setting))
         if setting in kwargs:
             # deliberately set, so we will action
-            axes.set(**{setting: value})
+            updates[setting] = _convert_period_value(axes, setting, kwargs.get(setting))
             continue
-        required_to_set = ("title", "xlabel", "ylabel")
-        if setting not in required_to_set:
+        if setting not in _REQUIRED_VALUE_KWARGS:
             # not set - and not required - so we can skip
             continue
 
-        # we will set these 'required_to_set' ones
+        # we will set these required ones
         # provided they are not already set
-        already_set = function.get(setting, fail)()
-        if already_set and value is None:
+        if function.get(setting, fail)():
             continue
 
-        # if we get here, we will set the value (implicitly to None)
-        axes.set(**{setting: value})
+        # if we get here, we will set the value to None
+        updates[setting] = None
+
+    # --- Axes.set() applies the updates in order, as the separate calls did
+    if updates:
+        axes.set(**updates)
 
 
 _SplatValue = bool | dict[str, Any] | Sequence[dict[str, Any]] | None
@@ -214,10 +236,12 @@ _SplatValue = bool | dict[str, Any] | Sequence[dict[str, Any]] | None
 # Keys in each splat-method's kwargs that are x-axis coordinates — when the
 # plot uses a PeriodIndex the axis is mapped to Period ordinals, so a Period
 # passed here must be converted to its ordinal for matplotlib.
-_PERIOD_COORD_KEYS: Final[dict[str, tuple[str, ...]]] = {
-    "axvline": ("x",),
-    "axvspan": ("xmin", "xmax"),
-}
+_PERIOD_COORD_KEYS: Final[Mapping[str, tuple[str, ...]]] = MappingProxyType(
+    {
+        "axvline": ("x",),
+        "axvspan": ("xmin", "xmax"),
+    }
+)
 
 
 def _convert_period_coords(axes: Axes, method_name: str, item: dict[str, Any]) -> dict[str, Any]:
@@ -250,7 +274,7 @@ def _convert_period_coords(axes: Axes, method_name: str, item: dict[str, Any]) -
 
 # Value-kwargs whose entries are x-axis coordinates — like axvline/axvspan, a
 # Period passed here must be converted to its ordinal on a period-mapped axes.
-_PERIOD_X_VALUE_KWARGS: Final[tuple[str, ...]] = ("xlim", "xticks")
+_PERIOD_X_VALUE_KWARGS: Final[frozenset[str]] = frozenset(("xlim", "xticks"))
 
 
 def _convert_period_value(axes: Axes, setting: str, value: object) -> object:
@@ -454,6 +478,10 @@ def _apply_splat(axes: Axes, method_name: str, value: _SplatValue) -> None:
 
 def apply_splat_kwargs(axes: Axes, settings: tuple, **kwargs: Unpack[FinaliseKwargs]) -> None:
     """Set matplotlib elements dynamically using setting_name and splat."""
+    if kwargs.keys().isdisjoint(settings):
+        return  # the common case: no spans, lines or legend requested
+
+    # iterate in settings order, as the legend must be made last
     for method_name in settings:
         if method_name not in kwargs:
             continue
@@ -483,19 +511,16 @@ def apply_annotations(axes: Axes, **kwargs: Unpack[FinaliseKwargs]) -> None:
         return
     fig = axes.figure
     fig_size = kwargs.get("figsize", get_setting("figsize"))
-    if not isinstance(fig, SubFigure):
+    if not isinstance(fig, SubFigure) and tuple(fig.get_size_inches()) != tuple(fig_size):
+        # only resize when needed, as resizing marks the figure stale
         fig.set_size_inches(*fig_size)
 
-    annotations = {
-        "rfooter": (0.99, 0.001, "right", "bottom"),
-        "lfooter": (0.01, 0.001, "left", "bottom"),
-        "rheader": (0.99, 0.999, "right", "top"),
-        "lheader": (0.01, 0.999, "left", "top"),
-    }
+    if kwargs.keys().isdisjoint(HEADER_FOOTER_KWARGS):
+        return  # the common case: no headers or footers
 
     for annotation in HEADER_FOOTER_KWARGS:
         if annotation in kwargs:
-            x_pos, y_pos, h_align, v_align = annotations[annotation]
+            x_pos, y_pos, h_align, v_align = _HEADER_FOOTER_PLACEMENT[annotation]
             fig.text(
                 x_pos,
                 y_pos,
@@ -515,14 +540,16 @@ def apply_late_kwargs(axes: Axes, **kwargs: Unpack[FinaliseKwargs]) -> None:
 
 def apply_kwargs(axes: Axes, **kwargs: Unpack[FinaliseKwargs]) -> None:
     """Apply settings found in kwargs."""
-
-    def check_kwargs(name: str) -> bool:
-        return name in kwargs and bool(kwargs.get(name))
+    # --- resolve the flags once
+    zero_y = bool(kwargs.get("zero_y"))
+    y0 = bool(kwargs.get("y0"))
+    x0 = bool(kwargs.get("x0"))
+    axisbelow = bool(kwargs.get("axisbelow"))
 
     apply_value_kwargs(axes, VALUE_KWARGS, **kwargs)
     apply_annotations(axes, **kwargs)
 
-    if check_kwargs("zero_y"):
+    if zero_y:
         bottom, top = axes.get_ylim()
         adj = (top - bottom) * ZERO_AXIS_ADJUSTMENT
         if bottom > -adj:
@@ -530,20 +557,70 @@ def apply_kwargs(axes: Axes, **kwargs: Unpack[FinaliseKwargs]) -> None:
         if top < adj:
             axes.set_ylim(top=adj)
 
-    if check_kwargs("y0"):
+    if y0:
         low, high = axes.get_ylim()
         if low < 0 < high:
             axes.axhline(y=0, lw=ZERO_LINE_WIDTH, c=ZERO_LINE_COLOR)
 
-    if check_kwargs("x0"):
+    if x0:
         low, high = axes.get_xlim()
         if low < 0 < high:
             axes.axvline(x=0, lw=ZERO_LINE_WIDTH, c=ZERO_LINE_COLOR)
 
-    if check_kwargs("axisbelow"):
+    if axisbelow:
         axes.set_axisbelow(True)
 
 
+# --- background file writing
+_pending_saves: list[Future[None]] = []
+
+
+@cache
+def _save_pool() -> ThreadPoolExecutor:
+    """Get the thread pool for background file writes, created on first use."""
+    return ThreadPoolExecutor(max_workers=BACKGROUND_SAVE_WORKERS, thread_name_prefix="mgplot-save")
+
+
+def _write_image(filepath: Path, image: bytes) -> None:
+    """Write a rendered image to file (runs on a background thread)."""
+    try:
+        filepath.write_bytes(image)
+    except OSError as e:
+        print(f"Error: Could not save plot to file: {e}")
+
+
+def _render_image(fig: Figure, file_type: str, dpi: int) -> bytes:
+    """Render the figure to an in-memory image of the given file type.
+
+    The image is then written to file with a single write, rather than
+    the many small writes matplotlib makes when saving to a path.
+    """
+    buffer = BytesIO()
+    fig.savefig(buffer, dpi=dpi, format=file_type)
+    return buffer.getvalue()
+
+
+def _save_in_background(fig: Figure, filepath: Path, file_type: str, dpi: int) -> None:
+    """Render the figure now, and write the image file on a background thread.
+
+    Rendering stays on the calling thread, as matplotlib is not thread-safe.
+    Only the file write is handed to the background thread.
+    """
+    image = _render_image(fig, file_type, dpi)
+    _pending_saves[:] = [f for f in _pending_saves if not f.done()]
+    _pending_saves.append(_save_pool().submit(_write_image, filepath, image))
+
+
+def wait_for_saves() -> None:
+    """Block until all background file writes have completed.
+
+    Only needed when the "background_save" setting is True, and the
+    program needs the image files before it continues (or exits).
+    """
+    wait(_pending_saves)
+    _pending_saves.clear()
+
+
 def save_to_file(fig: Figure, **kwargs: Unpack[FinaliseKwargs]) -> None:
     """Save the figure to file."""
     saving = not kwargs.get("dont_save", False)  # save by default
@@ -578,7 +655,10 @@ def save_to_file(fig: Figure, **kwargs: Unpack[FinaliseKwargs]) -> None:
         filename = "-".join(filter(None, filename_parts))
         filepath = chart_dir / f"{filename}.{file_type}"
 
-        fig.savefig(filepath, dpi=dpi)
+        if get_setting("background_save"):
+            _save_in_background(fig, filepath, file_type, dpi)
+        else:
+            filepath.write_bytes(_render_image(fig, file_type, dpi))
 
     except (
         OSError,
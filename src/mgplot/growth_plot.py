@@ -6,14 +6,15 @@ Key functions:
 - series_growth_plot()
 """
 
-from collections.abc import Callable
-from typing import NotRequired, Unpack, cast
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
+from typing import Final, NotRequired, Unpack, cast
 
 from matplotlib.axes import Axes
 from numpy import nan
 from pandas import DataFrame, Period, PeriodIndex, Series, period_range
 
-from mgplot.axis_utils import map_periodindex, set_labels
+from mgplot.axis_utils import map_periodindex, period_ordinals, set_labels
 from mgplot.bar_plot import bar_plot
 from mgplot.keyword_checking import (
     BaseKwargs,
@@ -29,8 +30,10 @@ from mgplot.utilities import check_clean_timeseries, constrain_data
 # --- constants
 
 # - frequency mappings
-FREQUENCY_TO_PERIODS = {"Q": 4, "M": 12, "D": 365}
-FREQUENCY_TO_NAME = {"Q": "Quarterly", "M": "Monthly", "D": "Daily"}
+FREQUENCY_TO_PERIODS: Final[Mapping[str, int]] = MappingProxyType({"Q": 4, "M": 12, "D": 365})
+FREQUENCY_TO_NAME: Final[Mapping[str, str]] = MappingProxyType(
+    {"Q": "Quarterly", "M": "Monthly", "D": "Daily"}
+)
 TWO_COLUMNS = 2
 
 
@@ -95,7 +98,7 @@ to_line_plot: TransitionKwargs = common_transitions | {
 # - constants for the bar plot
 to_bar_plot: TransitionKwargs = common_transitions | {
     # arg-to-growth_plot : (arg-to-bar_plot, default_value)
-    "bar_width": ("width", 0.8),
+    "bar_width": ("width", None),  # None: bar_plot() uses the bar_width setting
     "bar_color": ("color", "#dd0000"),
     "annotate_bars": ("annotate", True),
     "bar_rounding": ("rounding", None),
@@ -129,27 +132,27 @@ def calc_growth(series: Series) -> DataFrame:
     # --- sanity checks
     if not isinstance(series, Series):
         raise TypeError("The series argument must be a pandas Series")
-    if not isinstance(series.index, PeriodIndex):
+    index = series.index
+    if not isinstance(index, PeriodIndex):
         raise TypeError("The series index must be a pandas PeriodIndex")
     if series.empty:
         raise ValueError("The series argument must not be empty")
-    freq = series.index.freqstr
+    freq = index.freqstr
     if not freq or freq[0] not in FREQUENCY_TO_PERIODS:
         raise ValueError("The series index must have a frequency of Q, M, or D")
-    if series.index.has_duplicates:
+    if index.has_duplicates:
         raise ValueError("The series index must not have duplicate values")
+    freq_key = freq[0]  # reindexing (below) keeps the frequency
 
     # --- ensure the index is complete and the date is sorted
-    complete = period_range(start=series.index.min(), end=series.index.max())
-    series = series.reindex(complete, fill_value=nan)
-    series = series.sort_index(ascending=True)
+    ordinals = period_ordinals(index)
+    contiguous = ordinals[-1] - ordinals[0] == len(ordinals) - 1
+    if not (index.is_monotonic_increasing and contiguous):
+        complete = period_range(start=index.min(), end=index.max())
+        series = series.reindex(complete, fill_value=nan)
+        series = series.sort_index(ascending=True)
 
     # --- calculate annual and periodic growth
-    freq = PeriodIndex(series.index).freqstr
-    if not freq or freq[0] not in FREQUENCY_TO_PERIODS:
-        raise ValueError("The series index must have a frequency of Q, M, or D")
-
-    freq_key = freq[0]
     ppy = FREQUENCY_TO_PERIODS[freq_key]
     annual = series.pct_change(periods=ppy) * 100
     periodic = series.pct_change(periods=1) * 100
@@ -198,7 +201,10 @@ def growth_plot(
 
     # --- series names
     annual.name = "Annual Growth"
-    freq = PeriodIndex(periodic.index).freqstr
+    index = periodic.index
+    if not isinstance(index, PeriodIndex):
+        raise TypeError("The data index must be a PeriodIndex")
+    freq = index.freqstr
     if freq and freq[0] in FREQUENCY_TO_NAME:
         periodic.name = FREQUENCY_TO_NAME[freq[0]] + " Growth"
     else:
@@ -10,15 +10,26 @@ of validation to help catch common mistakes in function calls.
 It is designed to be used interactively and in scripts.
 """
 
+import os
 import textwrap
-from collections.abc import Callable, Mapping, Sequence
+from collections.abc import Callable, Generator, Mapping, Sequence
 from collections.abc import Set as AbstractSet
+from contextlib import contextmanager
 from types import UnionType
 from typing import Any, Final, NotRequired, ReadOnly, TypedDict, Union, get_args, get_origin
 
 # --- constants
-PEELABLE: Final = (NotRequired, Final, ReadOnly)
+PEELABLE: Final = frozenset((NotRequired, Final, ReadOnly))
+# the origins of the parameterised types that are checked, for O(1) membership tests
+SEQUENCE_ORIGINS: Final = frozenset((list, tuple, Sequence))
+MAPPING_ORIGINS: Final = frozenset((Mapping, dict))
+SET_ORIGINS: Final = frozenset((AbstractSet, set, frozenset))
+UNION_ORIGINS: Final = frozenset((UnionType, Union))
 _DEBUG_ENABLED: bool = False
+# keyword validation is a developer aid: skip it under python -O or with MGPLOT_VALIDATE=0
+_VALIDATION_ENABLED: bool = __debug__ and os.environ.get("MGPLOT_VALIDATE", "1") != "0"
+# schemas whose next validation is skipped, see validation_suspended()
+_SKIP_NEXT: Final[set[type[Any]]] = set()
 
 TransitionKwargs = dict[str, tuple[str, Any]]
 
@@ -48,15 +59,30 @@ def report_kwargs(
         print(f"{caller} kwargs:\n{wrapped}\n".strip())
 
 
+# Cache the keyword names for each TypedDict schema, for performance
+_cached_schema_keys: dict[type[Any], frozenset[str]] = {}
+
+
+def schema_keys(schema: type[Any]) -> frozenset[str]:
+    """Return the keyword names declared by a TypedDict.
+
+    TypedDicts do not change after they are defined, so the names are
+    cached per schema. A type without annotations has no keyword names.
+    """
+    keys = _cached_schema_keys.get(schema)
+    if keys is None:
+        keys = frozenset(getattr(schema, "__annotations__", {}))
+        _cached_schema_keys[schema] = keys
+    return keys
+
+
 def limit_kwargs(
     expected: type[Any],
     **kwargs: Any,
 ) -> dict[str, Any]:
     """Limit the keyword arguments to those in the expected TypedDict."""
-    if hasattr(expected, "__annotations__"):
-        annotations = dict(expected.__annotations__)
-        return {k: v for k, v in kwargs.items() if k in annotations}
-    return {}
+    keys = schema_keys(expected)
+    return {k: v for k, v in kwargs.items() if k in keys}
 
 
 def package_kwargs(mapping: TransitionKwargs, **kwargs: Any) -> dict[str, Any]:
@@ -76,6 +102,54 @@ def package_kwargs(mapping: TransitionKwargs, **kwargs: Any) -> dict[str, Any]:
     return {v[0]: kwargs.get(k, v[1]) for k, v in mapping.items() if k in kwargs or v[1] is not None}
 
 
+# Cache the expected types and required keys for each TypedDict schema
+_cached_schema_shapes: dict[type[Any], tuple[dict[str, Any], tuple[str, ...]]] = {}
+
+
+def schema_shape(
+    schema: type[Any] | dict[str, Any],
+    caller: str,
+) -> tuple[dict[str, Any], tuple[str, ...]]:
+    """Return the expected types and the required keys for a schema.
+
+    Args:
+        schema: A TypedDict, or a dict mapping keyword names to types.
+        caller: str - The name of the calling function, used in errors.
+
+    The result is cached for TypedDicts, which do not change after they
+    are defined. Plain dicts are mutable, so they are examined on each call.
+
+    """
+    if isinstance(schema, dict):
+        scheme = schema
+    elif hasattr(schema, "__annotations__"):
+        if schema in _cached_schema_shapes:
+            return _cached_schema_shapes[schema]
+        scheme = dict(schema.__annotations__)
+    else:
+        raise TypeError(f"Expected a TypedDict or dict, got {type(schema).__name__} in {caller}().")
+
+    required = tuple(k for k, v in scheme.items() if get_origin(v) is not NotRequired)
+    if not isinstance(schema, dict):
+        _cached_schema_shapes[schema] = (scheme, required)
+    return scheme, required
+
+
+# Cache the compiled type checks for each TypedDict schema, filled as keywords are seen
+_cached_schema_checks: dict[type[Any], dict[str, Callable[[Any], bool]]] = {}
+
+
+def schema_checks(schema: type[Any] | dict[str, Any]) -> dict[str, Callable[[Any], bool]]:
+    """Return the table of compiled type checks for a schema, keyed by keyword name.
+
+    The table starts empty and is filled by validate_kwargs() as keywords
+    are seen. Plain dicts are mutable, so they get a fresh table each call.
+    """
+    if isinstance(schema, dict):
+        return {}
+    return _cached_schema_checks.setdefault(schema, {})
+
+
 def validate_kwargs(schema: type[Any] | dict[str, Any], caller: str, **kwargs: Any) -> None:
     """Validate the types of keyword arguments against expected types.
 
@@ -86,56 +160,75 @@ def validate_kwargs(schema: type[Any] | dict[str, Any], caller: str, **kwargs: A
 
     Prints error messages for any mismatched types.
 
+    Note: this is a no-op when validation is disabled, see set_validation_enabled().
+
     """
+    if not _VALIDATION_ENABLED or skip_next(schema):
+        return
+
     # --- Extract the expected types from the schema
-    if hasattr(schema, "__annotations__"):
-        scheme = dict(schema.__annotations__)
-    elif isinstance(schema, dict):
-        scheme = schema
-    else:
-        raise TypeError(f"Expected a TypedDict or dict, got {type(schema).__name__} in {caller}().")
+    scheme, required = schema_shape(schema, caller)
+    checks = schema_checks(schema)
+
+    # --- Report unexpected keywords, found with one set difference on the key views
+    unexpected = kwargs.keys() - scheme.keys()
+    if unexpected:
+        report_unexpected(unexpected, caller, kwargs)
 
     # --- Check for type mismatches
     dprint("--------------------------")
     for key, value in kwargs.items():
-        if key in scheme:
-            expected = scheme[key]
-            if not check(value, expected):
-                dprint("Bad ---> ", end="")
-                print(
-                    textwrap.fill(
-                        f"Mismatched type: '{key}={value}' must be "
-                        f"of type '{peel(expected)}', in {caller}().",
-                        width=79,
-                    ),
-                )
-            else:
-                dprint(
-                    textwrap.fill(
-                        f"Good: ---> {key}={value} matched {peel(expected)} in {caller}().",
-                        width=79,
-                    ),
-                )
-        else:
+        if key in unexpected:
+            continue
+        expected = scheme[key]
+        checker = checks.get(key)
+        if checker is None:
+            checker = checks[key] = compile_check(expected)
+        if not checker(value):
+            dprint("Bad ---> ", end="")
             print(
                 textwrap.fill(
-                    f"Unexpected keyword argument '{key}' received by {caller}(). "
-                    "Please check the function call.",
+                    f"Mismatched type: '{key}={value}' must be of type '{peel(expected)}', in {caller}().",
+                    width=79,
+                ),
+            )
+        elif _DEBUG_ENABLED:  # only format the message when it will be printed
+            dprint(
+                textwrap.fill(
+                    f"Good: ---> {key}={value} matched {peel(expected)} in {caller}().",
                     width=79,
                 ),
             )
         dprint("--------------------------")
 
     # --- check for missing requirements
-    for k, v in scheme.items():
-        origin = get_origin(v)
-        if origin is NotRequired:
-            continue
+    for k in required:
         if k not in kwargs:
             print(f"A required keyword argument '{k}' is missing in {caller}().")
 
 
 # --- private functions
+def skip_next(schema: type[Any] | dict[str, Any]) -> bool:
+    """Consume a pending skip for the schema, see validation_suspended()."""
+    if _SKIP_NEXT and isinstance(schema, type) and schema in _SKIP_NEXT:
+        _SKIP_NEXT.discard(schema)  # already validated by the caller
+        return True
+    return False
+
+
+def report_unexpected(unexpected: AbstractSet[str], caller: str, kwargs: Mapping[str, Any]) -> None:
+    """Report the unexpected keyword arguments, in the order they were received."""
+    for key in kwargs:
+        if key in unexpected:
+            print(
+                textwrap.fill(
+                    f"Unexpected keyword argument '{key}' received by {caller}(). "
+                    "Please check the function call.",
+                    width=79,
+                ),
+            )
+
+
 def peel(expected: type[Any]) -> type[Any]:
     """Peel off peelable annotations from the expected type.
 
@@ -161,7 +254,8 @@ def check(value: Any, expected: type) -> bool:
         expected: type - The expected type(s).
 
     """
-    dprint(f"check(): implemented {value=} {expected=}")
+    if _DEBUG_ENABLED:
+        dprint(f"check(): implemented {value=} {expected=}")
 
     good = False
     if origin := get_origin(expected):
@@ -169,20 +263,14 @@ def check(value: Any, expected: type) -> bool:
         match origin:
             case _ if origin in PEELABLE:
                 good = check_peelable(value, expected)
-            case _ if origin in (list, tuple, Sequence) and origin not in (
-                str,
-                bytes,
-                bytearray,
-                memoryview,
-                range,
-                iter,
-            ):
+            case _ if origin in SEQUENCE_ORIGINS:
+                # note: string-like origins are not in SEQUENCE_ORIGINS
                 good = check_sequence(value, expected)
-            case _ if origin in (Mapping, dict):
+            case _ if origin in MAPPING_ORIGINS:
                 good = check_mapping(value, expected)
-            case _ if origin in (AbstractSet, set, frozenset):
+            case _ if origin in SET_ORIGINS:
                 good = check_set(value, expected)
-            case _ if origin in (UnionType, Union):
+            case _ if origin in UNION_ORIGINS:
                 good = check_union(value, expected)
             case _ if origin is Callable:
                 # signatures are not checked, only callability
@@ -341,6 +429,189 @@ def check_set(value: Any, expected: type) -> bool:
     return all(check(item, args[0]) for item in value)
 
 
+# --- compiled checks
+# compile_check() does the same job as check(), but examines the structure of
+# the expected type once, returning a predicate that only has to examine the
+# value. As the schemas are fixed, validate_kwargs() can reuse the predicates.
+_compiled_checks: dict[Any, Callable[[Any], bool]] = {}
+
+
+def compile_check(expected: type) -> Callable[[Any], bool]:
+    """Return a predicate equivalent to check(value, expected).
+
+    Args:
+        expected: type - The expected type(s).
+
+    The predicates are cached by the expected type, where it is hashable.
+
+    """
+    try:
+        return _compiled_checks[expected]
+    except KeyError:
+        checker = _compiled_checks[expected] = build_check(expected)
+        return checker
+    except TypeError:
+        return build_check(expected)  # unhashable, so not cached
+
+
+def build_check(expected: type) -> Callable[[Any], bool]:
+    """Build a predicate that examines whether a value matches the expected type.
+
+    Args:
+        expected: type - The expected type(s).
+
+    """
+    origin = get_origin(expected)
+    if not origin:
+        # simple types, and parameterisable types without parameters
+        if expected is Any:
+            return lambda _value: True
+        return lambda value: isinstance(value, expected)
+
+    # a parameterised type, with parameters
+    match origin:
+        case _ if origin in PEELABLE:
+            checker = compile_check(peel(expected))
+        case _ if origin in SEQUENCE_ORIGINS:
+            # note: string-like origins are not in SEQUENCE_ORIGINS
+            checker = compile_sequence(expected)
+        case _ if origin in MAPPING_ORIGINS:
+            checker = compile_mapping(expected)
+        case _ if origin in SET_ORIGINS:
+            checker = compile_set(expected)
+        case _ if origin in UNION_ORIGINS:
+            checker = compile_union(expected)
+        case _ if origin is Callable:
+            # signatures are not checked, only callability
+            checker = callable
+        case _:
+            checkable = hasattr(expected, "__origin__")
+
+            def checker(value: Any) -> bool:
+                print(f"Keyword checking: {value} not checked against {expected}")
+                return isinstance(value, expected) if checkable else True
+
+    return checker
+
+
+def compile_union(expected: type) -> Callable[[Any], bool]:
+    """Build a predicate for a value that is of one of the types in a Union.
+
+    The plain classes in the Union are folded into a single isinstance()
+    test, which runs first; only the parameterised types need their own
+    predicates.
+    """
+    args = get_args(expected)
+    if Any in args:
+        return lambda _value: True
+    simple = tuple(arg for arg in args if not get_origin(arg) and isinstance(arg, type))
+    checkers = tuple(compile_check(arg) for arg in args if arg not in simple)
+    if not checkers:
+        return lambda value: isinstance(value, simple)
+    return lambda value: isinstance(value, simple) or any(checker(value) for checker in checkers)
+
+
+def compile_sequence(expected: type) -> Callable[[Any], bool]:
+    """Build a predicate for a value that is a sequence of the expected type."""
+    if get_origin(expected) is tuple:
+        tuple_checker = compile_tuple(expected)
+        # Empty sequence is always valid for any type of sequence
+        return lambda value: not value or tuple_checker(value)
+
+    expected_args = get_args(expected)
+    if len(expected_args) != 1:
+
+        def unchecked(value: Any) -> bool:
+            if not value:
+                return True
+            if not isinstance(value, Sequence):
+                return False
+            print(f"Keyword checking: {value} not checked against {expected}")
+            return True
+
+        return unchecked
+
+    item_checker = compile_check(expected_args[0])
+    return lambda value: (
+        not value or (isinstance(value, Sequence) and all(item_checker(item) for item in value))
+    )
+
+
+def compile_tuple(expected: type) -> Callable[[Any], bool]:
+    """Build a predicate for a value that is a tuple of the expected type."""
+    expected_args = get_args(expected)
+    homog_tuple_arity = 2
+
+    # --- Empty tuple ==> tuple[()] -- rare case
+    if len(expected_args) == 0:
+        return lambda value: isinstance(value, tuple) and len(value) == 0
+
+    # --- Arbitrary length homogeneous tuples ==> e.g. tuple[int, ...]
+    if len(expected_args) == homog_tuple_arity and expected_args[-1] is Ellipsis:
+        item_checker = compile_check(expected_args[0])
+        return lambda value: isinstance(value, tuple) and all(item_checker(item) for item in value)
+
+    # --- Fixed length tuple ==> e.g. tuple[int, str]
+    checkers = tuple(compile_check(arg) for arg in expected_args)
+    return lambda value: (
+        isinstance(value, tuple)
+        and (
+            len(value) == 0
+            or (
+                len(value) == len(checkers)
+                and all(checker(item) for checker, item in zip(checkers, value, strict=True))
+            )
+        )
+    )
+
+
+def compile_mapping(expected: type) -> Callable[[Any], bool]:
+    """Build a predicate for a value that is a mapping of the expected types."""
+    origin = get_origin(expected)
+    if origin is None:
+        # should never happen, but just in case
+        raise TypeError("Expected a mapping type with parameters")
+    args = get_args(expected)
+    map_arity = 2
+    if len(args) != map_arity:
+
+        def unchecked(value: Any) -> bool:
+            if not isinstance(value, origin):
+                return False
+            if value:
+                print(f"Keyword checking: {value} not checked against {expected}")
+            return True
+
+        return unchecked
+
+    key_checker, value_checker = compile_check(args[0]), compile_check(args[1])
+    return lambda value: (
+        isinstance(value, origin) and all(key_checker(k) and value_checker(v) for k, v in value.items())
+    )
+
+
+def compile_set(expected: type) -> Callable[[Any], bool]:
+    """Build a predicate for a value that is a set of the expected type."""
+    origin = get_origin(expected)
+    if origin is None:
+        # should never happen, but just in case
+        raise TypeError("Expected a set type with parameters")
+    args = get_args(expected)
+    if len(args) != 1:
+
+        def unchecked(value: Any) -> bool:
+            if not isinstance(value, origin):
+                return False
+            if value:
+                print(f"Keyword checking: {value} not checked against {expected}")
+            return True
+
+        return unchecked
+
+    item_checker = compile_check(args[0])
+    return lambda value: isinstance(value, origin) and all(item_checker(item) for item in value)
+
+
 # --- debug print function
 def dprint(*args: Any, **kwargs: Any) -> None:
     """Output debugging information.
@@ -361,3 +632,42 @@ def set_debug_enabled(*, enabled: bool) -> None:
     """
     global _DEBUG_ENABLED
     _DEBUG_ENABLED = enabled
+
+
+def set_validation_enabled(*, enabled: bool) -> None:
+    """Enable or disable keyword argument validation.
+
+    Validation is on by default. It starts off when Python runs with -O,
+    or when the MGPLOT_VALIDATE environment variable is "0".
+
+    Args:
+        enabled: Whether validate_kwargs() should check keyword arguments.
+
+    """
+    global _VALIDATION_ENABLED
+    _VALIDATION_ENABLED = enabled
+
+
+@contextmanager
+def validation_suspended(*schemas: type[Any]) -> Generator[None]:
+    """Skip the next validation against each of the given schemas.
+
+    For callers that have already validated the keyword arguments they
+    pass on. Only the first validate_kwargs() call for each schema is
+    skipped, which is the entry check of the called function. Any later
+    calls are still validated, such as those a plot function makes to
+    other plot functions with keyword arguments it has built itself.
+
+    Args:
+        schemas: The TypedDicts whose next validation is skipped.
+
+    Note: Any unused skips are dropped on exit, even if an exception is raised.
+
+    """
+    previous = set(_SKIP_NEXT)
+    _SKIP_NEXT.update(schemas)
+    try:
+        yield
+    finally:
+        _SKIP_NEXT.clear()
+        _SKIP_NEXT.update(previous)
@@ -1,9 +1,11 @@
 """Plot a series or a dataframe with lines."""
 
-import math
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Mapping, Sequence
+from functools import lru_cache
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, Final, NotRequired, TypedDict, Unpack
 
+import numpy as np
 from matplotlib.axes import Axes
 from matplotlib.text import Text
 from pandas import DataFrame, Period, PeriodIndex, Series
@@ -12,7 +14,7 @@ from pandas.api.types import is_numeric_dtype
 from mgplot.annotation_utils import register_annotations
 from mgplot.axis_utils import map_periodindex, set_labels
 from mgplot.keyword_checking import BaseKwargs, report_kwargs, validate_kwargs
-from mgplot.settings import DataT, get_setting
+from mgplot.settings import DataT, get_setting, register_derived_cache
 from mgplot.utilities import (
     apply_defaults,
     check_clean_timeseries,
@@ -29,6 +31,25 @@ if TYPE_CHECKING:
 ME: Final[str] = "line_plot"
 DEFAULT_NEAR_END: Final[float] = 0.1  # fraction-of-width threshold for snapping labels to the edge
 
+# line defaults that do not depend on the data or the settings
+STATIC_LINE_DEFAULTS: Final[Mapping[str, Any]] = MappingProxyType(
+    {
+        "alpha": 1.0,
+        "drawstyle": None,
+        "marker": None,
+        "markersize": 10,
+        "zorder": None,
+        "dropna": True,
+        "annotate": False,
+        "rounding": True,
+        "fontsize": "small",
+        "fontname": "Helvetica",
+        "rotation": 0,
+        "annotate_color": True,
+        "label_series": True,
+    }
+)
+
 
 class LineKwargs(BaseKwargs):
     """Keyword arguments for the line_plot function."""
@@ -78,14 +99,16 @@ def annotate_series(
     Returns the created Text artist (or None if there was nothing to annotate)
     so the caller can register it for end-of-line collision resolution.
     """
-    # --- check the series has a value to annotate
-    latest: Series = series.dropna()
-    if latest.empty or not is_numeric_dtype(latest):
+    # --- check the series has a value to annotate (find it without copying the series)
+    if not is_numeric_dtype(series):
         return None
-    x: int | float = latest.index[-1]  # type: ignore[assignment]
-    y: int | float = latest.iloc[-1]
-    if y is None or math.isnan(y):
+    values = series.to_numpy(dtype=float, na_value=np.nan)
+    present = ~np.isnan(values)
+    if not present.any():
         return None
+    last = len(present) - 1 - int(present[::-1].argmax())  # argmax stops at the first True
+    x: int | float = series.index[last]
+    y = float(values[last])
 
     # --- extract fontsize - could be None, bool, int or str.
     fontsize = kwargs.get("fontsize", "small")
@@ -113,6 +136,33 @@ def annotate_series(
     )
 
 
+@lru_cache(maxsize=64)
+def line_defaults(item_count: int, *, wide: bool) -> Mapping[str, Any]:
+    """Get the default plot-line attributes for a number of lines.
+
+    Args:
+        item_count: Number of data series to plot (columns in DataFrame)
+        wide: Whether to use the wide line width (for shorter series)
+
+    Note: results are cached, and the cache is cleared by set_setting().
+
+    """
+    force_lines_styles = 4
+    return MappingProxyType(
+        {
+            "style": (
+                "solid" if item_count <= force_lines_styles else ("solid", "dashed", "dashdot", "dotted")
+            ),
+            "width": get_setting("line_wide") if wide else get_setting("line_normal"),
+            "color": get_color_list(item_count),
+            **STATIC_LINE_DEFAULTS,
+        }
+    )
+
+
+register_derived_cache(line_defaults.cache_clear)
+
+
 def get_style_width_color_etc(
     item_count: int,
     num_data_points: int,
@@ -131,30 +181,8 @@ def get_style_width_color_etc(
 
     """
     data_point_thresh = 151  # switch from wide to narrow lines
-    force_lines_styles = 4
-
-    line_defaults: dict[str, Any] = {
-        "style": ("solid" if item_count <= force_lines_styles else ["solid", "dashed", "dashdot", "dotted"]),
-        "width": (
-            get_setting("line_normal") if num_data_points > data_point_thresh else get_setting("line_wide")
-        ),
-        "color": get_color_list(item_count),
-        "alpha": 1.0,
-        "drawstyle": None,
-        "marker": None,
-        "markersize": 10,
-        "zorder": None,
-        "dropna": True,
-        "annotate": False,
-        "rounding": True,
-        "fontsize": "small",
-        "fontname": "Helvetica",
-        "rotation": 0,
-        "annotate_color": True,
-        "label_series": True,
-    }
-
-    return apply_defaults(item_count, line_defaults, dict(kwargs))
+    defaults = line_defaults(item_count, wide=num_data_points <= data_point_thresh)
+    return apply_defaults(item_count, defaults, dict(kwargs))
 
 
 def line_plot(data: DataT, **kwargs: Unpack[LineKwargs]) -> Axes:
@@ -174,7 +202,7 @@ def line_plot(data: DataT, **kwargs: Unpack[LineKwargs]) -> Axes:
 
     # --- check the data
     data = check_clean_timeseries(data, ME)
-    df = DataFrame(data)  # we are only plotting DataFrames
+    df = DataFrame(data, copy=False)  # we are only plotting DataFrames (a new wrapper, not a copy)
     df, kwargs_d = constrain_data(df, **kwargs)
 
     # --- convert PeriodIndex to Integer Index
@@ -187,7 +215,9 @@ def line_plot(data: DataT, **kwargs: Unpack[LineKwargs]) -> Axes:
 
     # --- Let's plot
     axes, kwargs_d = get_axes(**kwargs_d)  # get the axes to plot on
-    if df.empty or df.isna().all().all():
+    valid = df.notna().to_numpy()  # one NaN scan, reused for each column below
+    all_missing = ~valid.any(axis=0)
+    if df.empty or all_missing.all():
         # Note: finalise plot should ignore an empty axes object
         print(f"Warning: No data to plot in {ME}().")
         return axes
@@ -197,43 +227,84 @@ def line_plot(data: DataT, **kwargs: Unpack[LineKwargs]) -> Axes:
     num_data_points = len(df)
     swce, kwargs_d = get_style_width_color_etc(item_count, num_data_points, **kwargs_d)
 
+    # --- flatten the per-line plot attributes once, rather than per column
+    line_specs = list(
+        zip(
+            swce["style"],
+            swce["width"],
+            swce["color"],
+            swce["alpha"],
+            swce["marker"],
+            swce["markersize"],
+            swce["drawstyle"],
+            swce["zorder"],
+            swce["dropna"],
+            swce["label_series"],
+            strict=False,  # apply_defaults() may repeat a list past item_count
+        )
+    )
+    anno_specs = list(
+        zip(
+            swce["annotate"],
+            swce["annotate_color"],
+            swce["rounding"],
+            swce["fontsize"],
+            swce["fontname"],
+            swce["rotation"],
+            strict=False,
+        )
+    )
+
+    x = df.index.to_numpy()  # shared by every column
+    # materialise each column once - numeric columns as float (nullable NA -> NaN),
+    # other columns as they are, so matplotlib can still plot them (eg. as categories)
+    values = [
+        column_data.to_numpy(dtype=float, na_value=np.nan)
+        if is_numeric_dtype(column_data)
+        else column_data.to_numpy()
+        for _, column_data in df.items()
+    ]
     drawn_lines: list[Line2D] = []  # every data line - obstacles for label de-collision
     annotations: list[tuple[Text, Line2D | None]] = []  # (label, the line it annotates)
     for i, column in enumerate(df.columns):
-        series = df[column]
-        series = series.dropna() if "dropna" in swce and swce["dropna"][i] else series
-        if series.empty or series.isna().all():
+        if all_missing[i]:  # so at least one value survives any dropna() below
             print(f"Warning: No data to plot for {column} in line_plot().")
             continue
+        style, width, line_color, alpha, marker, markersize, drawstyle, zorder, dropna, label_series = (
+            line_specs[i]
+        )
+        # drop the NaNs with the precomputed mask, rather than a dropna() per column
+        keep = valid[:, i] if dropna else slice(None)
 
         lines = axes.plot(
             # using matplotlib, as pandas can set xlabel/ylabel
-            series.index,  # x
-            series,  # y
-            ls=swce["style"][i],
-            lw=swce["width"][i],
-            color=swce["color"][i],
-            alpha=swce["alpha"][i],
-            marker=swce["marker"][i],
-            ms=swce["markersize"][i],
-            drawstyle=swce["drawstyle"][i],
-            zorder=swce["zorder"][i],
-            label=(column if "label_series" in swce and swce["label_series"][i] else f"_{column}_"),
+            # and handing over NumPy arrays, to skip matplotlib's pandas unpacking
+            x[keep],  # x
+            values[i][keep],  # y
+            ls=style,
+            lw=width,
+            color=line_color,
+            alpha=alpha,
+            marker=marker,
+            ms=markersize,
+            drawstyle=drawstyle,
+            zorder=zorder,
+            label=(column if label_series else f"_{column}_"),
         )
         drawn_lines.extend(lines)
 
-        if swce["annotate"][i] is None or not swce["annotate"][i]:
+        annotate, annotate_color, rounding, fontsize, fontname, rotation = anno_specs[i]
+        if not annotate:
             continue
 
-        color = swce["color"][i] if swce["annotate_color"][i] is True else swce["annotate_color"][i]
         text = annotate_series(
-            series,
+            df.iloc[:, i],  # annotates the last valid value, so NaNs need not be dropped
             axes,
-            color=color,
-            rounding=swce["rounding"][i],
-            fontsize=swce["fontsize"][i],
-            fontname=swce["fontname"][i],
-            rotation=swce["rotation"][i],
+            color=line_color if annotate_color is True else annotate_color,
+            rounding=rounding,
+            fontsize=fontsize,
+            fontname=fontname,
+            rotation=rotation,
         )
         if text is not None:
             annotations.append((text, lines[0] if lines else None))
@@ -56,7 +56,9 @@ from mgplot.keyword_checking import (
     BaseKwargs,
     limit_kwargs,
     report_kwargs,
+    schema_keys,
     validate_kwargs,
+    validation_suspended,
 )
 from mgplot.line_plot import LineKwargs, line_plot
 from mgplot.postcovid_plot import PostcovidKwargs, postcovid_plot
@@ -198,17 +200,15 @@ def plot_then_finalise(
     )
     validate_kwargs(schema=kw_types, caller=me, **kwargs)
 
-    # --- call the first function with the data and selected plot kwargs
-    axes = first(data, **plot_kwargs)
+    # --- prepare finalise kwargs, in one pass (remove overlapping arguments)
+    # Arguments that were already used in the plot function are not passed on.
+    finalise_keys = schema_keys(FinaliseKwargs)
+    fp_kwargs = {k: v for k, v in kwargs.items() if k in finalise_keys and k not in plot_kwargs}
 
-    # --- prepare finalise kwargs (remove overlapping arguments)
-    fp_kwargs = limit_kwargs(FinaliseKwargs, **kwargs)
-    # Remove any arguments that were already used in the plot function
-    used_plot_args = set(plot_kwargs.keys())
-    fp_kwargs = {k: v for k, v in fp_kwargs.items() if k not in used_plot_args}
-
-    # --- finalise the plot
-    finalise_plot(axes, **fp_kwargs)
+    # --- plot and finalise, without the entry checks validating the kwargs a second time
+    with validation_suspended(expected, FinaliseKwargs):
+        axes = first(data, **plot_kwargs)
+        finalise_plot(axes, **fp_kwargs)
 
 
 def multi_start(
@@ -310,8 +310,7 @@ def multi_column(
         del kwargs["function"]  # remove the function key if it is empty
 
     # --- iterate over the columns
-    for i, col in enumerate(data.columns):
-        series = data[col]  # Extract as Series, not single-column DataFrame
+    for i, (col, series) in enumerate(data.items()):  # each column as a Series
         kwargs["title"] = f"{title_stem}{col}" if title_stem else str(col)
         kwargs["tag"] = _generate_tag(tag, i)
         first(series, **kwargs)
@@ -1,11 +1,15 @@
 """Plot the linear pre-COVID trajectory against the current data."""
 
-from typing import Literal, NotRequired, Unpack, cast
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Final, Literal, NotRequired, Unpack, cast
 
 from matplotlib.axes import Axes
-from numpy import array, polyfit
-from pandas import DataFrame, Period, PeriodIndex, Series, period_range
+from numpy import isnan, ndarray
+from pandas import DataFrame, Period, PeriodIndex, Series, concat, period_range
 
+from mgplot.axis_utils import period_ordinals
 from mgplot.keyword_checking import (
     report_kwargs,
     validate_kwargs,
@@ -19,11 +23,13 @@ ME = "postcovid_plot"
 MIN_REGRESSION_POINTS = 10  # minimum number of points for a useful linear regression
 
 # Default regression periods by frequency
-DEFAULT_PERIODS = {
-    "Q": {"start": "2014Q4", "end": "2019Q4"},
-    "M": {"start": "2015-01", "end": "2020-01"},
-    "D": {"start": "2015-01-01", "end": "2020-01-01"},
-}
+DEFAULT_PERIODS: Final[Mapping[str, Mapping[str, str]]] = MappingProxyType(
+    {
+        "Q": MappingProxyType({"start": "2014Q4", "end": "2019Q4"}),
+        "M": MappingProxyType({"start": "2015-01", "end": "2020-01"}),
+        "D": MappingProxyType({"start": "2015-01-01", "end": "2020-01-01"}),
+    }
+)
 
 
 class PostcovidKwargs(LineKwargs):
@@ -34,6 +40,18 @@ class PostcovidKwargs(LineKwargs):
 
 
 # --- functions
+def _linear_fit(x: ndarray, y: ndarray) -> tuple[float, float]:
+    """Fit y = slope * x + intercept by ordinary least squares.
+
+    Closed form for a straight line, working on plain float arrays.
+    Returns the tuple (slope, intercept).
+    """
+    x_mean, y_mean = x.mean(), y.mean()
+    x_deviation = x - x_mean
+    slope = (x_deviation * (y - y_mean)).sum() / (x_deviation**2).sum()
+    return float(slope), float(y_mean - slope * x_mean)
+
+
 def get_projection(source: Series, to_period: Period) -> Series:
     """Create a linear projection based on pre-COVID data.
 
@@ -60,23 +78,22 @@ def get_projection(source: Series, to_period: Period) -> Series:
         return Series(dtype=float)  # return empty series if validation fails
 
     # --- Drop any missing data and establish the input data for regression
-    source_no_nan = source.dropna()
-    input_series = source_no_nan[source_no_nan.index <= to_period]
+    ordinals = period_ordinals(source.index)
+    values = source.to_numpy(dtype=float)
+    in_sample = ~isnan(values) & (ordinals <= to_period.ordinal)
+    x_cause = ordinals[in_sample].astype(float)
+    y_effect = values[in_sample]
 
     # --- further validation
-    if input_series.empty or len(input_series) < MIN_REGRESSION_POINTS:
+    if len(y_effect) < MIN_REGRESSION_POINTS:
         print("Insufficient data points for regression.")
         return Series(dtype=float)  # return empty series if no data for regression
 
     # --- Establish the simple linear regression model
-    input_index = input_series.index
-    x_cause = array([p.ordinal for p in input_index if p <= to_period])
-    y_effect = input_series.to_numpy()
-    slope, intercept = polyfit(x_cause, y_effect, 1)
+    slope, intercept = _linear_fit(x_cause, y_effect)
 
     # --- use the regression model to create an out-of-sample projection
-    x_complete = array([p.ordinal for p in source.index])
-    projection = Series((x_complete * slope) + intercept, index=source.index)
+    projection = Series((ordinals * slope) + intercept, index=source.index)
 
     # --- ensure the projection covers any date gaps in the PeriodIndex
     source_index = source.index
@@ -85,6 +102,16 @@ def get_projection(source: Series, to_period: Period) -> Series:
     )
 
 
+@lru_cache(maxsize=16)
+def default_regression_period(freq_str: str) -> tuple[Period, Period]:
+    """Return the default (start, end) regression Periods for a frequency.
+
+    The default period strings are parsed once per frequency, not per plot.
+    """
+    default_periods = DEFAULT_PERIODS[freq_str[0]]
+    return Period(default_periods["start"], freq=freq_str), Period(default_periods["end"], freq=freq_str)
+
+
 def regression_period(data: Series, **kwargs: Unpack[PostcovidKwargs]) -> tuple[Period, Period, bool]:
     """Establish the regression period.
 
@@ -110,9 +137,7 @@ def regression_period(data: Series, **kwargs: Unpack[PostcovidKwargs]) -> tuple[
         raise ValueError("The series index must have a D, M or Q frequency")
 
     # --- set the default regression period, use user provided periods if specified
-    default_periods = DEFAULT_PERIODS[freq_key]
-    start_regression = Period(default_periods["start"], freq=freq_str)
-    end_regression = Period(default_periods["end"], freq=freq_str)
+    start_regression, end_regression = default_regression_period(freq_str)
 
     user_start = kwargs.pop("start_r", None)
     user_end = kwargs.pop("end_r", None)
@@ -178,7 +203,7 @@ def postcovid_plot(data: DataT, **kwargs: Unpack[PostcovidKwargs]) -> Axes:
     # --- combine data and projection
     if start_r < data.dropna().index.min():
         print(f"Caution: Regression start period pre-dates the series index: {start_r=}")
-    recent_data = data[data.index >= start_r].copy()
+    recent_data = data[period_ordinals(cast("PeriodIndex", data.index)) >= start_r.ordinal]
     recent_data.name = "Series"
     projection_data = get_projection(recent_data, end_r)
     if projection_data.empty:
@@ -186,12 +211,7 @@ def postcovid_plot(data: DataT, **kwargs: Unpack[PostcovidKwargs]) -> Axes:
     projection_data.name = "Pre-COVID projection"
 
     # --- Create DataFrame with proper column alignment
-    combined_data = DataFrame(
-        {
-            projection_data.name: projection_data,
-            recent_data.name: recent_data,
-        }
-    )
+    combined_data = concat([projection_data, recent_data], axis=1)
 
     # --- activate plot settings
     kwargs["width"] = kwargs.pop(
@@ -1,9 +1,11 @@
 """Managing global default settings."""
 
-from collections.abc import Generator
+from collections.abc import Callable, Generator, Mapping, Sequence
 from contextlib import contextmanager
 from dataclasses import dataclass, fields
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Final, TypeVar
 
 import matplotlib as mpl
@@ -20,11 +22,27 @@ DEFAULT_MAX_TICKS: Final[int] = 13  # Reasonable default for x-axis ticks
 
 
 # --- global plot settings
-plt.style.use("fivethirtyeight")
-mpl.rcParams["font.size"] = 11
+# Applied once per session. importlib.reload() re-runs this module in its
+# existing namespace, so the flag survives, and a reload neither re-parses
+# the style file nor overwrites any rcParams the user has since changed.
+_style_applied: bool = globals().get("_style_applied", False)
+if not _style_applied:
+    plt.style.use("fivethirtyeight")
+    mpl.rcParams["font.size"] = 11
+    _style_applied = True
 
 
 # --- default settings
+def freeze_colors(colors: Mapping[int, Sequence[str]]) -> Mapping[int, tuple[str, ...]]:
+    """Return a read-only copy of a colors setting.
+
+    get_color_list() caches results derived from this setting, and that
+    cache is only cleared by set_setting(). A read-only copy means the
+    setting cannot be changed in place, where the cache would miss it.
+    """
+    return MappingProxyType({count: tuple(palette) for count, palette in colors.items()})
+
+
 @dataclass
 class DefaultTypes:
     """Types for the global settings of the mgplot module."""
@@ -42,10 +60,11 @@ class DefaultTypes:
     legend_font_size: float | str
     legend: dict[str, Any]
 
-    colors: dict[int, list[str]]  # used by get_color_list()
+    colors: Mapping[int, tuple[str, ...]]  # used by get_color_list(), read-only, see freeze_colors()
 
     chart_dir: str
     max_ticks: int  # default for x-axis ticks
+    background_save: bool  # write image files on a background thread
 
 
 mgplot_defaults = DefaultTypes(
@@ -61,23 +80,26 @@ mgplot_defaults = DefaultTypes(
         "loc": "best",
         "fontsize": "x-small",
     },
-    colors={
-        1: ["blue"],
-        5: ["darkblue", "darkorange", "cornflowerblue", "brown", "gray"],
-        9: [
-            "darkblue",
-            "darkorange",
-            "forestgreen",
-            "#dd0000",
-            "purple",
-            "gold",
-            "lightcoral",
-            "lightseagreen",
-            "gray",
-        ],
-    },
+    colors=freeze_colors(
+        {
+            1: ["blue"],
+            5: ["darkblue", "darkorange", "cornflowerblue", "brown", "gray"],
+            9: [
+                "darkblue",
+                "darkorange",
+                "forestgreen",
+                "#dd0000",
+                "purple",
+                "gold",
+                "lightcoral",
+                "lightseagreen",
+                "gray",
+            ],
+        }
+    ),
     chart_dir=DEFAULT_CHART_DIR,
     max_ticks=DEFAULT_MAX_TICKS,
+    background_save=False,
 )
 
 
@@ -100,6 +122,29 @@ def get_fields() -> list[str]:
     return _cached_fields
 
 
+# Cache-clearing functions for values derived from the settings
+_derived_caches: list[Callable[[], None]] = []
+
+
+def register_derived_cache(cache_clear: Callable[[], None]) -> None:
+    """Register a cache that must be cleared whenever a setting changes.
+
+    Args:
+        cache_clear: Callable[[], None] - typically the cache_clear method
+            of a function decorated with functools.lru_cache.
+
+    """
+    _derived_caches.append(cache_clear)
+
+
+def clear_cache() -> None:
+    """Clear the cached settings, and any caches derived from them."""
+    get_setting.cache_clear()
+    for cache_clear in _derived_caches:
+        cache_clear()
+
+
+@lru_cache(maxsize=128)
 def get_setting(setting: str) -> Any:
     """Get a setting from the global settings.
 
@@ -112,6 +157,9 @@ def get_setting(setting: str) -> Any:
     Returns:
         value: Any - the value of the setting
 
+    Note: change settings with set_setting(), which also clears the caches
+    derived from them. The colors setting is read-only for this reason.
+
     """
     if setting not in get_fields():
         raise KeyError(f"Setting '{setting}' not found in mgplot_defaults.")
@@ -140,8 +188,14 @@ def set_setting(setting: str, value: Any) -> None:
         raise ValueError(f"dpi must be a positive integer, got {value}")
     if setting == "max_ticks" and (not isinstance(value, int) or value <= 0):
         raise ValueError(f"max_ticks must be a positive integer, got {value}")
+    if setting == "background_save" and not isinstance(value, bool):
+        raise ValueError(f"background_save must be a bool, got {type(value)}")
+
+    if setting == "colors" and isinstance(value, Mapping):
+        value = freeze_colors(value)
 
     setattr(mgplot_defaults, setting, value)
+    clear_cache()
 
 
 def clear_chart_dir() -> None:
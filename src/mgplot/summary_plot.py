@@ -156,9 +156,11 @@ def plot_latest_datapoint(
 
     ax.scatter(adjusted.iloc[-1], adjusted.columns, color="darkorange", label="Latest")
     row = adjusted.index[-1]
-    for col_num, col_name in enumerate(original.columns):
-        raw_adj = adjusted.at[row, col_name]
-        raw_orig = original.at[row, col_name]
+    # take the latest row once, rather than a scalar lookup per column
+    latest_adj = adjusted.loc[row][original.columns].tolist()
+    latest_orig = original.loc[row].tolist()
+    columns = zip(original.columns, latest_adj, latest_orig, strict=True)
+    for col_num, (col_name, raw_adj, raw_orig) in enumerate(columns):
         if not isinstance(raw_adj, SupportsFloat) or not isinstance(raw_orig, SupportsFloat):
             raise TypeError(f"Expected numeric data for {col_name}, got {type(raw_orig).__name__}")
         x_adj = float(raw_adj)
@@ -194,8 +196,9 @@ def label_extremes(
             s=SMALL_MARKER_SIZE,
             label="Median",
         )
-        for col_num, col_name in enumerate(original.columns):
-            minima, maxima = original[col_name].min(), original[col_name].max()
+        # reduce all the columns at once, rather than one column at a time
+        extremes = zip(original.min().tolist(), original.max().tolist(), strict=True)
+        for col_num, (minima, maxima) in enumerate(extremes):
             min_precision = 2 if abs(minima) < HIGH_PRECISION_THRESHOLD else 1
             max_precision = 2 if abs(maxima) < HIGH_PRECISION_THRESHOLD else 1
             ax.text(
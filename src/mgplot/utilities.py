@@ -11,6 +11,8 @@ Functions:
 """
 
 import math
+from collections.abc import Mapping
+from functools import lru_cache
 from typing import Any, Final
 
 import numpy as np
@@ -20,7 +22,7 @@ from matplotlib.pyplot import subplots
 from pandas import DataFrame, Period, PeriodIndex, RangeIndex, Series
 from pandas.api.types import is_integer_dtype
 
-from mgplot.settings import DataT, get_setting
+from mgplot.settings import DataT, get_setting, register_derived_cache
 
 # --- Constants
 DEFAULT_ROUNDING_VALUE: Final[int] = 10
@@ -43,6 +45,18 @@ def missing(data: DataT, caller: str) -> None:
         )
 
 
+def from_value(data: DataT, value: Period | int) -> DataT:
+    """Keep the rows of data whose index is at or after value.
+
+    A sorted index is cut by binary search, without a boolean mask.
+    Callers such as bar_plot() do not check that the index is sorted,
+    so an unsorted index falls back to the mask.
+    """
+    if data.index.is_monotonic_increasing:
+        return data.iloc[data.index.searchsorted(value) :]  # type: ignore[arg-type]
+    return data.loc[data.index >= value]
+
+
 # --- public functions
 def check_clean_timeseries(data: DataT, caller: str = "") -> DataT:
     """Check the coherence of timeseries data.
@@ -81,7 +95,8 @@ def check_clean_timeseries(data: DataT, caller: str = "") -> DataT:
     if start is None:
         return data  # no valid index, return original data
 
-    data = data.loc[data.index >= start]  # type: ignore[operator]
+    # the index is unique and sorted, so slice from the start, without a boolean mask
+    data = data.iloc[data.index.get_loc(start) :]
     missing(data, caller=caller)
     return data
 
@@ -107,9 +122,9 @@ def constrain_data(data: DataT, **kwargs: Any) -> tuple[DataT, dict[str, Any]]:
 
     if isinstance(plot_from, Period):
         if isinstance(data.index, PeriodIndex):
-            data = data.loc[data.index >= plot_from]
+            data = from_value(data, plot_from)
         elif is_integer_dtype(data.index):
-            data = data.loc[data.index >= plot_from.ordinal]
+            data = from_value(data, plot_from.ordinal)
 
     elif isinstance(plot_from, int):
         if isinstance(data.index, PeriodIndex):
@@ -120,7 +135,7 @@ def constrain_data(data: DataT, **kwargs: Any) -> tuple[DataT, dict[str, Any]]:
                 # assume negative and small positive integers are iloc
                 data = data.iloc[plot_from:]
             else:
-                data = data.loc[data.index >= plot_from]
+                data = from_value(data, plot_from)
 
     else:
         print(
@@ -132,7 +147,7 @@ def constrain_data(data: DataT, **kwargs: Any) -> tuple[DataT, dict[str, Any]]:
 
 def apply_defaults(
     series_count: int,
-    defaults: dict[str, Any],
+    defaults: Mapping[str, Any],
     kwargs_d: dict[str, Any],
 ) -> tuple[dict[str, Any], dict[str, list[Any] | tuple[Any]]]:
     """Apply default arguments where necessary.
@@ -153,13 +168,11 @@ def apply_defaults(
     returnable = {}  # return vehicle
 
     for option, default in defaults.items():
-        val = kwargs_d.get(option, default)
+        # take the option out of the kwargs dictionary, falling back to the default
+        val = kwargs_d.pop(option, default)
         # make sure our return value is a list/tuple
         returnable[option] = val if isinstance(val, (list | tuple)) else (val,)
 
-        # remove the option from the kwargs dictionary
-        kwargs_d.pop(option, None)
-
         # repeat multi-item lists if not long enough for all lines to be plotted
         if len(returnable[option]) < series_count and series_count > 1:
             multiplier = math.ceil(series_count / len(returnable[option]))
@@ -168,26 +181,32 @@ def apply_defaults(
     return returnable, kwargs_d
 
 
-def get_color_list(count: int) -> list[str]:
+@lru_cache(maxsize=64)
+def get_color_list(count: int) -> tuple[str, ...]:
     """Get a list of colours for plotting.
 
     Args:
         count: the number of colours to return
 
     Returns:
-        A list of colours.
+        A tuple of colours.
+
+    Note: results are cached, and the cache is cleared by set_setting().
 
     """
-    colors: dict[int, list[str]] = get_setting("colors")
+    colors: Mapping[int, tuple[str, ...]] = get_setting("colors")
     if count in colors:
-        return colors[count]
+        return tuple(colors[count])
 
     if count < max(colors.keys()):
         options = [k for k in colors if k > count]
-        return colors[min(options)][:count]
+        return tuple(colors[min(options)][:count])
 
     c = colormaps["nipy_spectral"](np.linspace(0, 1, count))
-    return [f"#{int(x * 255):02x}{int(y * 255):02x}{int(z * 255):02x}" for x, y, z, _ in c]
+    return tuple(f"#{int(x * 255):02x}{int(y * 255):02x}{int(z * 255):02x}" for x, y, z, _ in c)
+
+
+register_derived_cache(get_color_list.cache_clear)
 
 
 def get_axes(**kwargs: Any) -> tuple[Axes, dict[str, Any]]:
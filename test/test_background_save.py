@@ -0,0 +1,54 @@
+"""Test writing image files on a background thread.
+
+Run with: uv run python test/test_background_save.py
+"""
+
+import tempfile
+from pathlib import Path
+
+import matplotlib
+
+matplotlib.use("Agg")
+import pandas as pd
+
+import mgplot as mg
+
+
+def test_background_save_writes_files() -> None:
+    """Test that background saves are all on disk after wait_for_saves()."""
+    data = pd.Series(range(12), index=pd.period_range("2020-01", periods=12, freq="M"))
+    with tempfile.TemporaryDirectory() as tmp:
+        mg.set_chart_dir(tmp)
+        mg.set_setting("background_save", True)
+        try:
+            for i in range(3):
+                mg.line_plot_finalise(data, title=f"Background {i}")
+            mg.wait_for_saves()
+        finally:
+            mg.set_setting("background_save", False)
+            mg.set_chart_dir(".")
+        written = sorted(p.name for p in Path(tmp).glob("*.png"))
+        expected = [f"background-{i}.png" for i in range(3)]
+        assert written == expected, f"Unexpected files: {written}"
+        for name in written:
+            assert (Path(tmp) / name).stat().st_size > 0, f"{name} is empty"
+
+    print("PASS: background saves written after wait_for_saves()")
+
+
+def test_background_save_rejects_non_bool() -> None:
+    """Test that the background_save setting must be a bool."""
+    try:
+        mg.set_setting("background_save", "yes")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("a non-bool background_save should be rejected")
+
+    print("PASS: background_save rejects non-bool values")
+
+
+if __name__ == "__main__":
+    test_background_save_writes_files()
+    test_background_save_rejects_non_bool()
+    print("\nAll background save tests passed.")
@@ -6,6 +6,7 @@ Covers:
 - grouped and stacked multi-column horizontal bars
 - stacked bars with negative values (sign-aware bases)
 - horizontal=True with a PeriodIndex warns and falls back to vertical
+- per-bar colours, including unhashable RGB lists
 - labels survive finalise_plot()
 """
 
@@ -106,6 +107,15 @@ def test_per_bar_colors() -> None:
     print("PASS: per-bar colours (both orientations)")
 
 
+def test_per_bar_rgb_list_colors() -> None:
+    """Per-bar colours given as (unhashable) RGB lists still annotate every bar."""
+    colors = [[1, 0, 0], [0, 0, 1], [0, 1, 0], [1, 1, 0], [0, 1, 1]]
+    ax = mg.bar_plot(make_series(), color=colors, annotate=True)
+    assert len(ax.texts) == len(colors), f"expected {len(colors)} labels, got {len(ax.texts)}"
+    plt.close("all")
+    print("PASS: per-bar RGB list colours")
+
+
 def test_labels_survive_finalise() -> None:
     """Category y labels are untouched by finalise_plot's refresh."""
     ax = mg.bar_plot(make_series(), horizontal=True)
@@ -122,5 +132,6 @@ if __name__ == "__main__":
     test_horizontal_stacked_negatives()
     test_periodindex_falls_back_to_vertical()
     test_per_bar_colors()
+    test_per_bar_rgb_list_colors()
     test_labels_survive_finalise()
     print("\nAll horizontal bar tests passed!")
@@ -0,0 +1,43 @@
+"""Test constraining data to start from plot_from.
+
+Run with: uv run python test/test_constrain_data.py
+"""
+
+import pandas as pd
+
+from mgplot.utilities import constrain_data
+
+
+def test_constrain_data_sorted() -> None:
+    """Test that a sorted index keeps the rows at or after plot_from."""
+    index = pd.period_range("2019Q1", periods=4, freq="Q")
+    series = pd.Series(range(4), index=index)
+    result, kwargs = constrain_data(series, plot_from=pd.Period("2019Q3", freq="Q"))
+    assert result.index.tolist() == list(index[2:]), "sorted PeriodIndex constrained incorrectly"
+    assert "plot_from" not in kwargs, "plot_from not removed from kwargs"
+
+    series = pd.Series(range(4), index=[100, 101, 102, 103])
+    result, _ = constrain_data(series, plot_from=102)
+    assert result.index.tolist() == [102, 103], "sorted integer index constrained incorrectly"
+
+    print("PASS: constrain_data sorted indexes")
+
+
+def test_constrain_data_unsorted() -> None:
+    """Test that an unsorted index (eg. bar data) keeps only the rows at or after plot_from."""
+    index = pd.PeriodIndex(["2021Q1", "2019Q1", "2022Q1", "2020Q1"], freq="Q")
+    frame = pd.DataFrame({"a": range(4)}, index=index)
+    result, _ = constrain_data(frame, plot_from=pd.Period("2021Q1", freq="Q"))
+    assert result.index.tolist() == [index[0], index[2]], "unsorted PeriodIndex constrained incorrectly"
+
+    series = pd.Series(range(4), index=[102, 100, 103, 101])
+    result, _ = constrain_data(series, plot_from=102)
+    assert result.index.tolist() == [102, 103], "unsorted integer index constrained incorrectly"
+
+    print("PASS: constrain_data unsorted indexes")
+
+
+if __name__ == "__main__":
+    test_constrain_data_sorted()
+    test_constrain_data_unsorted()
+    print("\nAll constrain_data tests passed.")
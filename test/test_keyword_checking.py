@@ -0,0 +1,150 @@
+"""Test the compiled keyword checks and the validation switch.
+
+Run with: uv run python test/test_keyword_checking.py
+"""
+
+from collections.abc import Callable, Mapping, Sequence
+from contextlib import redirect_stdout
+from io import StringIO
+from typing import Any, NotRequired
+
+from mgplot.bar_plot import BarKwargs
+from mgplot.finalise_plot import FinaliseKwargs
+from mgplot.keyword_checking import (
+    check,
+    compile_check,
+    set_validation_enabled,
+    validate_kwargs,
+    validation_suspended,
+)
+from mgplot.line_plot import LineKwargs
+
+EXPECTED_TYPES: list[Any] = [
+    int,
+    str,
+    Any,
+    NotRequired[float],
+    int | float,
+    list[int],
+    list[int | str],
+    Sequence[str],
+    tuple[()],
+    tuple[int, ...],
+    tuple[int, str],
+    dict[str, int],
+    Mapping[str, list[float]],
+    set[str],
+    frozenset[int],
+    Callable[[str], str],
+    NotRequired[bool | list[bool] | tuple[str, ...] | None],
+    NotRequired[str | int | float],
+    str | list[int] | None,
+    int | Any,
+]
+
+VALUES: list[Any] = [
+    None,
+    0,
+    1.5,
+    True,
+    "text",
+    "",
+    [],
+    [1, 2],
+    [1, "a"],
+    ["a", "b"],
+    (),
+    (1,),
+    (1, 2),
+    (1, "a"),
+    ("a", "b"),
+    {},
+    {"a": 1},
+    {"a": [1.0]},
+    {1: "a"},
+    set(),
+    {"a"},
+    frozenset({1}),
+    str.upper,
+]
+
+
+def test_compiled_matches_check() -> None:
+    """Test compile_check() against check() for a matrix of types and values."""
+    for expected in EXPECTED_TYPES:
+        checker = compile_check(expected)
+        for value in VALUES:
+            assert checker(value) == check(value, expected), f"mismatch for {value!r} against {expected}"
+
+    print("PASS: compiled checks match check()")
+
+
+def test_compiled_matches_check_for_schemas() -> None:
+    """Test compile_check() against check() for the package's own keyword types."""
+    for schema in (BarKwargs, FinaliseKwargs, LineKwargs):
+        for key, expected in schema.__annotations__.items():
+            checker = compile_check(expected)
+            for value in VALUES:
+                assert checker(value) == check(value, expected), f"mismatch for {key}={value!r}"
+
+    print("PASS: compiled checks match check() for the keyword schemas")
+
+
+def test_compiled_checks_are_cached() -> None:
+    """Test that the same annotation yields the same compiled predicate."""
+    assert compile_check(list[int]) is compile_check(list[int])
+
+    print("PASS: compiled checks are cached")
+
+
+def test_validation_can_be_disabled() -> None:
+    """Test that validate_kwargs() is silent when validation is disabled."""
+    out = StringIO()
+    with redirect_stdout(out):
+        validate_kwargs(LineKwargs, "test", junk=1)
+    assert "Unexpected keyword argument 'junk'" in out.getvalue()
+
+    out = StringIO()
+    set_validation_enabled(enabled=False)
+    try:
+        with redirect_stdout(out):
+            validate_kwargs(LineKwargs, "test", junk=1)
+    finally:
+        set_validation_enabled(enabled=True)
+    assert not out.getvalue()
+
+    print("PASS: validation can be disabled")
+
+
+def test_suspension_skips_only_the_next_check() -> None:
+    """Test that validation_suspended() skips one check per schema, then validates again."""
+    outputs = []
+    with validation_suspended(LineKwargs):
+        for _ in range(2):
+            out = StringIO()
+            with redirect_stdout(out):
+                validate_kwargs(LineKwargs, "test", junk=1)
+            outputs.append(out.getvalue())
+    assert not outputs[0]  # the entry check is skipped
+    assert "Unexpected keyword argument 'junk'" in outputs[1]  # a nested check is not
+
+    out = StringIO()
+    with validation_suspended(LineKwargs), redirect_stdout(out):
+        validate_kwargs(BarKwargs, "test", junk=1)  # other schemas are still checked
+    assert "Unexpected keyword argument 'junk'" in out.getvalue()
+
+    out = StringIO()
+    with redirect_stdout(out):
+        validate_kwargs(LineKwargs, "test", junk=1)  # an unused skip does not outlive the context
+    assert "Unexpected keyword argument 'junk'" in out.getvalue()
+
+    print("PASS: suspension skips only the next check")
+
+
+if __name__ == "__main__":
+    test_compiled_matches_check()
+    test_compiled_matches_check_for_schemas()
+    test_compiled_checks_are_cached()
+    test_validation_can_be_disabled()
+    test_suspension_skips_only_the_next_check()
+    print("\nAll keyword checking tests passed.")
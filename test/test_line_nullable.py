@@ -0,0 +1,73 @@
+"""Test that line_plot handles pandas nullable and mixed dtypes.
+
+Run with: uv run python test/test_line_nullable.py
+"""
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from mgplot import line_plot
+
+
+def _mixed_frame() -> pd.DataFrame:
+    """Return a frame with a nullable Float64 column alongside a plain float column."""
+    return pd.DataFrame(
+        {
+            "a": pd.array([1.5, None, 3, 4, 5, 6], dtype="Float64"),
+            "b": [1.0, 2, 3, 4, 5, 6],
+        },
+        index=pd.period_range("2020-01", periods=6, freq="M"),
+    )
+
+
+def test_line_plot_nullable_keep_na() -> None:
+    """Test that pd.NA is plotted as a gap when NaNs are not dropped."""
+    fig, ax = plt.subplots()
+    line_plot(_mixed_frame(), ax=ax, dropna=False)
+
+    lines = ax.get_lines()
+    assert len(lines) == 2, f"Expected 2 lines, got {len(lines)}"
+    y = np.asarray(lines[0].get_ydata(), dtype=float)
+    assert len(y) == 6, f"Expected 6 points, got {len(y)}"
+    assert np.isnan(y[1]), "pd.NA should be plotted as NaN"
+
+    plt.close()
+    print("PASS: line_plot nullable dtype (dropna=False)")
+
+
+def test_line_plot_nullable_dropna() -> None:
+    """Test that pd.NA is dropped when NaNs are dropped."""
+    fig, ax = plt.subplots()
+    line_plot(_mixed_frame(), ax=ax)
+
+    lines = ax.get_lines()
+    assert len(lines[0].get_ydata()) == 5, "pd.NA should be dropped"
+    assert len(lines[1].get_ydata()) == 6, "plain column should keep every point"
+
+    plt.close()
+    print("PASS: line_plot nullable dtype (dropna=True)")
+
+
+def test_line_plot_mixed_dtypes() -> None:
+    """Test that a non-numeric column does not stop the numeric columns being plotted."""
+    df = pd.DataFrame(
+        {"a": [1.0, 2, 3, 4], "b": ["w", "x", "y", "z"]},
+        index=pd.period_range("2020-01", periods=4, freq="M"),
+    )
+    fig, ax = plt.subplots()
+    line_plot(df, ax=ax)
+
+    lines = ax.get_lines()
+    assert len(lines) == 2, f"Expected 2 lines, got {len(lines)}"
+    assert list(lines[0].get_ydata()) == [1.0, 2.0, 3.0, 4.0], "numeric column plotted incorrectly"
+
+    plt.close()
+    print("PASS: line_plot mixed numeric and string columns")
+
+
+if __name__ == "__main__":
+    test_line_plot_nullable_keep_na()
+    test_line_plot_nullable_dropna()
+    test_line_plot_mixed_dtypes()
+    print("\nAll nullable dtype tests passed.")
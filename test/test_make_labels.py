@@ -0,0 +1,35 @@
+"""Test making tick labels for a PeriodIndex.
+
+Run with: uv run python test/test_make_labels.py
+"""
+
+import pandas as pd
+
+from mgplot.axis_utils import make_labels
+
+
+def _monthly(ordinals: list[int]) -> pd.PeriodIndex:
+    """Build a monthly PeriodIndex from ordinals."""
+    return pd.PeriodIndex([pd.Period(ordinal=o, freq="M") for o in ordinals])
+
+
+def test_make_labels_contiguous() -> None:
+    """Test that a contiguous index labels every period."""
+    labels = make_labels(_monthly([600, 601, 602, 603]), max_ticks=13)
+    assert [p.ordinal for p in labels] == [600, 601, 602, 603], f"unexpected ticks: {labels}"
+
+    print("PASS: make_labels contiguous index")
+
+
+def test_make_labels_duplicate_and_gap() -> None:
+    """Test that a duplicate does not hide a gap of the same size."""
+    labels = make_labels(_monthly([600, 601, 601, 603]), max_ticks=13)
+    assert [p.ordinal for p in labels] == [600, 601, 602, 603], f"gap not filled: {labels}"
+
+    print("PASS: make_labels duplicate plus gap")
+
+
+if __name__ == "__main__":
+    test_make_labels_contiguous()
+    test_make_labels_duplicate_and_gap()
+    print("\nAll make_labels tests passed.")
@@ -0,0 +1,51 @@
+"""Test mapping a PeriodIndex to an integer index.
+
+Run with: uv run python test/test_map_periodindex.py
+"""
+
+import pandas as pd
+
+from mgplot.axis_utils import map_periodindex
+
+
+def _mapped_index(index: pd.PeriodIndex) -> list[int]:
+    """Map a Series with the given index and return the new index as a list."""
+    series = pd.Series(range(len(index)), index=index)
+    result = map_periodindex(series)
+    assert result is not None, "a PeriodIndex should be mapped"
+    mapped, og_index = result
+    assert og_index.equals(index), "original index not returned"
+    return mapped.index.tolist()
+
+
+def test_map_periodindex_complete() -> None:
+    """Test that complete indexes map to their ordinals, in either direction."""
+    index = pd.period_range("2020Q1", periods=4, freq="Q")
+    expected = [p.ordinal for p in index]
+    assert _mapped_index(index) == expected, "ascending index mapped incorrectly"
+    assert _mapped_index(index[::-1]) == expected[::-1], "descending index mapped incorrectly"
+    assert _mapped_index(index[:1]) == expected[:1], "single period mapped incorrectly"
+
+    print("PASS: map_periodindex complete indexes")
+
+
+def test_map_periodindex_gaps() -> None:
+    """Test that an index with gaps maps each period to its ordinal."""
+    index = pd.PeriodIndex([pd.Period("2020-01", "M"), pd.Period("2020-03", "M"), pd.Period("2020-07", "M")])
+    assert _mapped_index(index) == [p.ordinal for p in index], "gappy index mapped incorrectly"
+
+    print("PASS: map_periodindex index with gaps")
+
+
+def test_map_periodindex_not_period() -> None:
+    """Test that a non-PeriodIndex is left alone."""
+    assert map_periodindex(pd.Series([1, 2, 3])) is None, "non-PeriodIndex should not be mapped"
+
+    print("PASS: map_periodindex ignores other indexes")
+
+
+if __name__ == "__main__":
+    test_map_periodindex_complete()
+    test_map_periodindex_gaps()
+    test_map_periodindex_not_period()
+    print("\nAll map_periodindex tests passed.")
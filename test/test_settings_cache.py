@@ -0,0 +1,69 @@
+"""Test that cached settings are refreshed when a setting changes.
+
+Run with: uv run python test/test_settings_cache.py
+"""
+
+from mgplot import get_setting, set_setting
+from mgplot.utilities import get_color_list
+
+
+def test_get_setting_refreshes_after_set() -> None:
+    """Test that get_setting() reflects a change made with set_setting()."""
+    original = get_setting("bar_width")
+    try:
+        set_setting("bar_width", 0.5)
+        assert get_setting("bar_width") == 0.5, "get_setting returned a stale value"
+    finally:
+        set_setting("bar_width", original)
+    assert get_setting("bar_width") == original, "bar_width not restored"
+
+    print("PASS: get_setting refreshes after set_setting")
+
+
+def test_get_color_list_refreshes_after_set() -> None:
+    """Test that get_color_list() reflects a change to the colors setting."""
+    original = get_setting("colors")
+    assert get_color_list(1) == tuple(original[1])
+    try:
+        set_setting("colors", {**original, 1: ["red"]})
+        assert get_color_list(1) == ("red",), "get_color_list returned a stale palette"
+    finally:
+        set_setting("colors", original)
+    assert get_color_list(1) == tuple(original[1]), "palette not restored"
+
+    print("PASS: get_color_list refreshes after set_setting")
+
+
+def test_colors_setting_is_read_only() -> None:
+    """Test that the colors setting cannot be changed in place, behind the cache."""
+    colors = get_setting("colors")
+    for mutate in (lambda: colors.__setitem__(1, ["red"]), lambda: colors[1].append("red")):
+        try:
+            mutate()
+        except (TypeError, AttributeError):
+            pass
+        else:
+            raise AssertionError("the colors setting was changed in place")
+    assert get_color_list(1) == tuple(colors[1]), "palette changed"
+
+    original = colors
+    try:
+        set_setting("colors", {**original, 1: ["red"]})
+        assert get_setting("colors")[1] == ("red",), "set_setting did not store the palette"
+        try:
+            get_setting("colors")[1] = ("blue",)
+        except TypeError:
+            pass
+        else:
+            raise AssertionError("a colors setting from set_setting() was changed in place")
+    finally:
+        set_setting("colors", original)
+
+    print("PASS: colors setting is read-only")
+
+
+if __name__ == "__main__":
+    test_get_setting_refreshes_after_set()
+    test_get_color_list_refreshes_after_set()
+    test_colors_setting_is_read_only()
+    print("\nAll settings cache tests passed.")